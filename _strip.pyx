@@ -0,0 +1,70 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -march=native -fopenmp
+# distutils: extra_link_args = -fopenmp
+"""
+Ahead-of-time compiled strip stress kernel (optional alternative to numba).
+
+Same closed form and surface limits as `bouss._strip_kernel_njit`. Build in place with:
+  cythonize -i _strip.pyx
+When the resulting extension is importable, `bouss.strip_stresses` uses it.
+"""
+
+from cython.parallel import prange
+from libc.math cimport atan2, cos, sin, fabs
+
+
+cpdef void strip_stresses(
+	const double[::1] x,
+	const double[::1] y,
+	const double[::1] z,
+	double b,
+	double q,
+	double q_pi,
+	double nu,
+	double c,
+	double s,
+	double cx,
+	double cy,
+	double z_epsilon,
+	double edge_tol,
+	double[::1] out_sz,
+	double[::1] out_sx,
+	double[::1] out_sy,
+	double[::1] out_txz,
+) noexcept:
+	"""Write (sigma_z, sigma_x, sigma_y, tau_xz) for every point into the output arrays.
+
+	Scalars are derived by the caller (`bouss.strip_stresses`): half width b, q, q/pi, nu,
+	cos/sin of the rotation, the center, and the surface / edge tolerances.
+	"""
+	cdef Py_ssize_t n = x.shape[0]
+	cdef Py_ssize_t i
+	cdef double xl, zi, ax, beta_prime, alpha, two_beta, sin_a, sa_c2b, sz
+
+	for i in prange(n, nogil=True, schedule="static"):
+		# Local strip coordinate (rotate by -angle about the center)
+		xl = c * (x[i] - cx) + s * (y[i] - cy)
+		zi = z[i]
+		if zi <= z_epsilon:
+			# Free-surface traction limits
+			ax = fabs(xl)
+			if ax < b - edge_tol:
+				out_sz[i] = q
+			elif fabs(ax - b) <= edge_tol:
+				out_sz[i] = 0.5 * q
+			else:
+				out_sz[i] = 0.0
+			out_sx[i] = 0.0
+			out_sy[i] = 0.0
+			out_txz[i] = 0.0
+		else:
+			beta_prime = atan2(xl - b, zi)
+			alpha = atan2(xl + b, zi) - beta_prime
+			two_beta = alpha + beta_prime + beta_prime
+			sin_a = sin(alpha)
+			sa_c2b = sin_a * cos(two_beta)
+			sz = q_pi * (sa_c2b + alpha)
+			out_sz[i] = sz
+			out_sx[i] = q_pi * (alpha - sa_c2b)
+			out_sy[i] = nu * sz
+			out_txz[i] = q_pi * sin_a * sin(two_beta)
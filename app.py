@@ -1,22 +1,53 @@
 import math
+from collections import OrderedDict
+from functools import wraps
 from typing import Tuple
+import base64
 import io
+import os
+import pathlib
+import tempfile
+import threading
+import uuid
 
 import numpy as np
 import plotly.graph_objects as go
-from dash import Dash, Input, Output, State, dcc, html, callback_context as ctx
+import plotly.io as pio
+from dash import ClientsideFunction, Dash, DiskcacheManager, Input, Output, Patch, State, dcc, html, callback_context as ctx
 from dash.exceptions import PreventUpdate
 
 from bouss import (
 	generate_line_points,
-	generate_plane_grid,
-	sigma_z_infinite_strip,
+	generate_plane_axes,
+	plane_broadcast_coordinates,
+	plane_coordinates,
+	plane_points,
+	strip_stresses,
+	strip_stresses_grid,
 	integrate_circular_sigma_z,
 	integrate_circular_stress_full,
+	trapezoid_sigma_z,
 )
 
+try:
+	import diskcache
+except ImportError:  # background callbacks need dash[diskcache]; compute runs inline without it
+	diskcache = None
 
-app = Dash(__name__, suppress_callback_exceptions=True)
+
+# Heavy compute callbacks run as background jobs when diskcache is available, so a large
+# grid does not hold a server worker. Results are kept per input set for this launch
+# (cache_by), so repeating a computation returns straight from the cache.
+if diskcache is not None:
+	_LAUNCH_UID = uuid.uuid4().hex
+	_CACHE_DIR = os.environ.get("BOUSS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "bouss_dash_cache"))
+	background_manager = DiskcacheManager(
+		diskcache.Cache(_CACHE_DIR), cache_by=[lambda: _LAUNCH_UID], expire=3600,
+	)
+else:
+	background_manager = None
+
+app = Dash(__name__, suppress_callback_exceptions=True, background_callback_manager=background_manager)
 app.title = "Boussinesq Strip Stress Analysis"
 # Expose WSGI server for gunicorn (e.g., app:server)
 server = app.server
@@ -25,19 +56,142 @@ server = app.server
 app.config.suppress_callback_exceptions = True
 
 
+def _encode_array(arr: np.ndarray, dtype=np.float32) -> dict:
+	"""Pack an array for dcc.Store as base64 raw bytes (much smaller than a JSON list)."""
+	arr = np.ascontiguousarray(arr, dtype=dtype)
+	return {
+		"b64": base64.b64encode(arr.tobytes()).decode("ascii"),
+		"dtype": arr.dtype.str,
+		"shape": list(arr.shape),
+	}
+
+
+def _decode_array(payload: dict) -> np.ndarray:
+	"""Inverse of `_encode_array`."""
+	buf = base64.b64decode(payload["b64"])
+	return np.frombuffer(buf, dtype=np.dtype(payload["dtype"])).reshape(payload["shape"])
+
+
+def _ints(*vals, default=None) -> tuple:
+	"""Coerce numeric callback inputs to int once at ingress (None -> default)."""
+	return tuple(int(v) if v is not None else default for v in vals)
+
+
+def _csv_string(header: str, *columns) -> str:
+	"""CSV text for equal-length columns, written by one np.savetxt call instead of per-row formatting."""
+	buf = io.StringIO()
+	# 10 significant digits: exact for the float32 stresses, ample for coordinates
+	np.savetxt(buf, np.column_stack(columns), delimiter=",", fmt="%.10g", header=header, comments="")
+	return buf.getvalue()
+
+
+def _round_key(*vals, ndigits: int = 6) -> tuple:
+	"""Hashable cache key from numeric inputs, rounded so float noise still hits the cache."""
+	return tuple(round(float(v), ndigits) for v in vals)
+
+
+# Range pairs (x, y, z) each plane spans; the other range fields are hidden in the UI
+_PLANE_RANGES = {"xy": (True, True, False), "xz": (True, False, True), "yz": (False, True, True)}
+
+
+def _require(**fields) -> None:
+	"""Reject blank numeric inputs by name, before they reach a memo key or a kernel."""
+	blank = [name for name, value in fields.items() if value is None]
+	if blank:
+		raise ValueError("blank input: " + ", ".join(blank))
+
+
+def _plane_key(plane: str, xmin, xmax, ymin, ymax, zmin, zmax) -> tuple:
+	"""`_round_key` of the ranges a plane uses; unused ranges (possibly blank) key as None."""
+	key = ()
+	for axis, used, lo, hi in zip("xyz", _PLANE_RANGES[plane], (xmin, ymin, zmin), (xmax, ymax, zmax)):
+		if used:
+			_require(**{f"{axis}min": lo, f"{axis}max": hi})
+		key += _round_key(lo, hi) if used else (None, None)
+	return key
+
+
+def _keyed_lru(fn, maxsize: int = 16):
+	"""LRU memo of fn keyed on an explicit key: `wrapper(key, *args)` runs `fn(*args)` on a miss.
+
+	Unlike lru_cache the key is not the arguments, so fn gets the original inputs while the
+	rounded (`_round_key`) form decides the hits.
+	"""
+	cache = OrderedDict()
+	lock = threading.Lock()
+
+	@wraps(fn)
+	def wrapper(key, *args):
+		with lock:
+			if key in cache:
+				cache.move_to_end(key)
+				return cache[key]
+		result = fn(*args)
+		with lock:
+			cache[key] = result
+			if len(cache) > maxsize:
+				cache.popitem(last=False)
+		return result
+
+	return wrapper
+
+
+def _background(button_id: str) -> dict:
+	"""Callback kwargs for a background compute job; the button is disabled while it runs."""
+	if background_manager is None:
+		return {}
+	return dict(
+		background=True,
+		running=[(Output(button_id, "disabled"), True, False)],
+		# Poll for the result every 250 ms (Dash defaults to 1 s, slow for small grids)
+		interval=250,
+		# The click count only triggers the job; it must not split the result cache
+		cache_args_to_ignore=[0],
+	)
+
+
+def _inline_memo(fn):
+	"""`_keyed_lru` for a field builder of a `_background` callback, applied only when it runs inline.
+
+	Each background job runs in a fresh process that exits after the call, so a per-process
+	cache would never hit there; the manager's result cache (cache_by) memoises those jobs.
+	Either way the builder is called as `fn(key, *args)`.
+	"""
+	if background_manager is None:
+		return _keyed_lru(fn)
+
+	@wraps(fn)
+	def uncached(_key, *args):
+		return fn(*args)
+
+	return uncached
+
+
+ASSETS_DIR = pathlib.Path(__file__).resolve().parent / "assets"
+
+
+def _svg_data_uri(name: str) -> str:
+	"""Inline an SVG from assets/ as a data URI (read once, no per-render asset request)."""
+	raw = (ASSETS_DIR / name).read_bytes()
+	return "data:image/svg+xml;base64," + base64.b64encode(raw).decode("ascii")
+
+
+_DIAGRAM_STYLE = {"width": "100%", "maxWidth": "520px", "height": "auto", "display": "block", "margin": "6px 0"}
+_STRIP_SVG = _svg_data_uri("strip.svg")
+_CIRCLE_SVG = _svg_data_uri("circle.svg")
+_TRAP_SVG = _svg_data_uri("trapezoid.svg")
+
+
 def svg_strip_diagram() -> html.Div:
-	# Replace with static asset SVG
-	return html.Div(html.Img(src="/assets/strip.svg", style={"width": "100%", "maxWidth": "520px", "height": "auto", "display": "block", "margin": "6px 0"}))
+	return html.Div(html.Img(src=_STRIP_SVG, style=_DIAGRAM_STYLE))
 
 
 def svg_circle_diagram() -> html.Div:
-	# Replace with static asset SVG
-	return html.Div(html.Img(src="/assets/circle.svg", style={"width": "100%", "maxWidth": "520px", "height": "auto", "display": "block", "margin": "6px 0"}))
+	return html.Div(html.Img(src=_CIRCLE_SVG, style=_DIAGRAM_STYLE))
 
 
 def svg_trap_diagram() -> html.Div:
-	# Replace with static asset SVG
-	return html.Div(html.Img(src="/assets/trapezoid.svg", style={"width": "100%", "maxWidth": "520px", "height": "auto", "display": "block", "margin": "6px 0"}))
+	return html.Div(html.Img(src=_TRAP_SVG, style=_DIAGRAM_STYLE))
 
 def layout_controls_strip() -> html.Div:
 	return html.Div(
@@ -753,12 +907,89 @@ def make_layout() -> html.Div:
 app.layout = make_layout()
 
 
+# Grids at least this large are drawn as one smoothed image (zsmooth="best") instead of
+# per-cell bricks; go.Heatmapgl is deprecated in Plotly, so the SVG trace is kept
+HEATMAP_SMOOTH_MIN_CELLS = 5000
+
+STRIP_LABELS = {"sigma_z": "σz", "sigma_x": "σx", "sigma_y": "σy", "tau_xz": "τxz"}
+CIRCLE_LABELS = {"sigma_z": "σz", "tau_rz": "τrz"}
+
+# Shared figure styling, registered once as a Plotly template; figures only set what varies
+pio.templates["bouss"] = go.layout.Template(layout=dict(
+	font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif", size=13),
+	margin=dict(l=60, r=20, t=50, b=50),
+	hovermode="closest",
+	plot_bgcolor="#ffffff",
+	paper_bgcolor="#ffffff",
+	dragmode="pan",
+	xaxis=dict(constrain="domain"),
+	yaxis=dict(constrain="domain"),
+))
+pio.templates.default = "plotly_white+bouss"
+
+
+def _plane_heat_title(plane: str, const_val: float, label: str) -> str:
+	if plane == "xy":
+		return f"{label} on XY plane at z={const_val}"
+	if plane == "xz":
+		return f"{label} on XZ plane at y={const_val}"
+	return f"{label} on YZ plane at x={const_val}"
+
+
+def _plane_heat_patch(plane: str, const_val: float, S: np.ndarray, label: str) -> Patch:
+	"""Partial figure update for a component switch: only the z-matrix and labels change."""
+	p = Patch()
+	p["data"][0]["z"] = S
+	p["data"][0]["name"] = label
+	p["data"][0]["colorbar"]["title"]["text"] = label
+	p["layout"]["title"]["text"] = _plane_heat_title(plane, const_val, label)
+	return p
+
+
+def _heatmap_trace(x_vals: np.ndarray, y_vals: np.ndarray, S: np.ndarray, label: str) -> go.Heatmap:
+	"""Viridis heatmap of a (ny, nx) field; shared by all three tabs."""
+	zsmooth = "best" if S.size >= HEATMAP_SMOOTH_MIN_CELLS else False
+	return go.Heatmap(x=x_vals, y=y_vals, z=S, colorscale="Viridis", colorbar_title=label, zsmooth=zsmooth)
+
+
+def _plane_heat_figure(
+	plane: str,
+	const_val: float,
+	x_vals: np.ndarray,
+	y_vals: np.ndarray,
+	S: np.ndarray,
+	label: str,
+	heat_display: str,
+	n_isobars: int,
+) -> go.Figure:
+	"""Heatmap or isobar figure of a (ny, nx) plane slice; shared by the strip and circle tabs."""
+	if plane == "xy":
+		layout = dict(xaxis_title="x", yaxis_title="y")
+	elif plane == "xz":
+		layout = dict(xaxis_title="x", yaxis_title="z")
+	else:
+		layout = dict(xaxis_title="y", yaxis_title="z")
+	layout["title"] = _plane_heat_title(plane, const_val, label)
+
+	if heat_display == "isobar":
+		trace = go.Contour(x=x_vals, y=y_vals, z=S, ncontours=n_isobars, contours=dict(coloring="lines", showlabels=True, labelfont=dict(size=10, color="black")), line=dict(width=1.2, color="black"), showscale=False, name=label)
+	else:
+		trace = _heatmap_trace(x_vals, y_vals, S, label)
+
+	fig = go.Figure(data=[trace])
+	# Show z=0 at top and deeper z at bottom for XZ and YZ
+	if plane in ("xz", "yz"):
+		layout["yaxis_autorange"] = "reversed"
+	fig.update_layout(height=520, **layout)
+	return fig
+
+
 # ---------- Callbacks (strip) ----------
+# Compute callbacks only fill the stores; figures are rebuilt from the stores, so
+# switching component / display / isobar count never re-runs the stress evaluation.
 @app.callback(
-	Output("line_fig", "figure"),
 	Output("line_store", "data"),
 	Input("btn_line", "n_clicks"),
-	Input("line_component", "value"),
 	State("q", "value"),
 	State("poisson_ratio", "value"),
 	State("width_b", "value"),
@@ -774,8 +1005,8 @@ app.layout = make_layout()
 	prevent_initial_call=True,
 )
 
-def update_line_fig(
-	_n_clicks: int,	line_component: str,
+def update_line_store(
+	_n_clicks: int,
 	q: float,
 	poisson_ratio: float,
 	B: float,
@@ -791,69 +1022,124 @@ def update_line_fig(
 ):
 	points = generate_line_points([lx0, ly0, lz0], [lx1, ly1, lz1], 200)
 	# Analytical stresses
-	sig_z, sig_x, sig_y, tau_xz = sigma_z_infinite_strip(
-		points,
+	sig_z, sig_x, sig_y, tau_xz = strip_stresses(
+		points[:, 0],
+		points[:, 1],
+		points[:, 2],
 		width_b=B,
 		uniform_pressure_q=q,
 		poisson_ratio=poisson_ratio,
 		rotation_deg=angle,
 		center_xy=(x0, y0)
 	)
-	# distance along the line for x-axis
-	dists = np.linalg.norm(points - points[0], axis=1)
-
-	# Select component
-	series_map = {
-		"sigma_z": (sig_z, "σz"),
-		"sigma_x": (sig_x, "σx"),
-		"sigma_y": (sig_y, "σy"),
-		"tau_xz": (tau_xz, "τxz"),
+	# distance along the line for x-axis (points are evenly spaced on a straight segment)
+	dists = np.linspace(0.0, math.dist((lx0, ly0, lz0), (lx1, ly1, lz1)), points.shape[0])
+
+	data = {
+		"s": _encode_array(dists, dtype=np.float64),
+		"x": _encode_array(points[:, 0], dtype=np.float64),
+		"y": _encode_array(points[:, 1], dtype=np.float64),
+		"z": _encode_array(points[:, 2], dtype=np.float64),
+		"sigma_z": _encode_array(sig_z),
+		"sigma_x": _encode_array(sig_x),
+		"sigma_y": _encode_array(sig_y),
+		"tau_xz": _encode_array(tau_xz),
 	}
-	y_vals, label = series_map.get(line_component, (sig_z, "σz"))
+	return data
+
 
+@app.callback(
+	Output("line_fig", "figure"),
+	Input("line_component", "value"),
+	Input("line_store", "data"),
+	prevent_initial_call=True,
+)
+def update_line_fig(line_component: str, data: dict):
+	if not data:
+		raise PreventUpdate
+	key = line_component if line_component in STRIP_LABELS else "sigma_z"
+	label = STRIP_LABELS[key]
+	# Stored as float32 (half the JSON payload of float64)
+	y_vals = _decode_array(data[key])
+	hovertemplate = "s=%{x:.2f}, " + label + "=%{y:.3f}<extra></extra>"
+	title = f"{label} along 3D path"
+	yaxis_title = f"{label} (same units as q)"
+
+	if ctx.triggered_id == "line_component":
+		# Component switch: patch the existing figure instead of resending it
+		p = Patch()
+		p["data"][0]["y"] = y_vals
+		p["data"][0]["name"] = label
+		p["data"][0]["hovertemplate"] = hovertemplate
+		p["layout"]["title"]["text"] = title
+		p["layout"]["yaxis"]["title"]["text"] = yaxis_title
+		return p
+
+	dists = _decode_array(data["s"])
 	fig = go.Figure()
 	fig.add_trace(
 		go.Scatter(x=dists, y=y_vals, mode="lines", name=label,
-			hovertemplate="s=%{x:.2f}, " + label + "=%{y:.3f}<extra></extra>")
+			hovertemplate=hovertemplate)
 	)
 	fig.update_layout(
-		template="plotly_white",
-		title=f"{label} along 3D path",
+		title=title,
 		xaxis_title="Path length s",
-		yaxis_title=f"{label} (same units as q)",
-		font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif", size=13),
-		margin=dict(l=60, r=20, t=50, b=50),
+		yaxis_title=yaxis_title,
 		height=420,
 		hovermode="x unified",
-		plot_bgcolor="#ffffff",
-		paper_bgcolor="#ffffff",
 		showlegend=False,
-		dragmode="pan",
-		xaxis=dict(constrain="domain"),
-		yaxis=dict(constrain="domain"),
 	)
 	# Remove draw tools from modebar
+	return fig
 
-	data = {
-        "s": dists.tolist(),
-        "x": points[:, 0].tolist(),
-        "y": points[:, 1].tolist(),
-        "z": points[:, 2].tolist(),
-        "sigma_z": sig_z.tolist(),
-        "sigma_x": sig_x.tolist(),
-        "sigma_y": sig_y.tolist(),
-        "tau_xz": tau_xz.tolist(),
-    }
-	return fig, data
+
+@_keyed_lru
+def _strip_heat_field(
+	plane: str,
+	nx: int,
+	ny: int,
+	const_val: float,
+	xmin: float,
+	xmax: float,
+	ymin: float,
+	ymax: float,
+	zmin: float,
+	zmax: float,
+	B: float,
+	q: float,
+	poisson_ratio: float,
+	angle: float,
+	x0: float,
+	y0: float,
+) -> Tuple[np.ndarray, ...]:
+	"""Strip stresses on a plane slice, memoised per process so repeat clicks are free.
+
+	Returns read-only (h_vals, v_vals, sigma_z, sigma_x, sigma_y, tau_xz); stresses are (ny, nx).
+	"""
+	# 1-D axes of the plane, broadcast against each other (no flat point list or reshape)
+	h_vals, v_vals = generate_plane_axes(plane, (xmin, xmax), (ymin, ymax), nx, ny, z_bounds=(zmin, zmax))
+	px, py, pz = plane_broadcast_coordinates(plane, const_val, h_vals, v_vals)
+	# Get all stress components
+	field = (h_vals, v_vals) + strip_stresses_grid(
+		px,
+		py,
+		pz,
+		width_b=B,
+		uniform_pressure_q=q,
+		poisson_ratio=poisson_ratio,
+		rotation_deg=angle,
+		center_xy=(x0, y0),
+		# Single precision is plenty for a colour map (the store is float32 anyway)
+		dtype=np.float32,
+	)
+	for arr in field:
+		arr.setflags(write=False)
+	return field
 
 
 @app.callback(
-	Output("heat_fig", "figure"),
 	Output("heat_store", "data"),
 	Input("btn_heat", "n_clicks"),
-	Input("heat_component", "value"),
-	Input("heat_display", "value"),
-	State("n_isobars", "value"),
 	State("q", "value"),
 	State("poisson_ratio", "value"),
 	State("width_b", "value"),
@@ -873,9 +1159,8 @@ def update_line_fig(
 	prevent_initial_call=True,
 )
 
-def update_heat_fig(
-	_n_clicks: int,	heat_component: str, heat_display: str,
-	n_isobars: int,
+def update_heat_store(
+	_n_clicks: int,
 	q: float,
 	poisson_ratio: float,
 	B: float,
@@ -893,95 +1178,113 @@ def update_heat_fig(
 	nx: int,
 	ny: int,
 ):
+	nx, ny = _ints(nx, ny)
 	plane = plane.lower()
-	if plane == "xy":
-		X, Y, Z = generate_plane_grid("xy", const_val, (xmin, xmax), (ymin, ymax), int(nx), int(ny))
-	elif plane == "xz":
-		X, Y, Z = generate_plane_grid("xz", const_val, (xmin, xmax), (zmin, zmax), int(nx), int(ny), z_bounds=(zmin, zmax))
-	else:
-		# For 'yz': third arg is x_bounds (unused), fourth is y_bounds
-		X, Y, Z = generate_plane_grid("yz", const_val, (0, 0), (ymin, ymax), int(nx), int(ny), z_bounds=(zmin, zmax))
-
-	pts = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
-	# Get all stress components
-	sig_z, sig_x, sig_y, tau_xz = sigma_z_infinite_strip(
-		pts,
-		width_b=B,
-		uniform_pressure_q=q,
-		poisson_ratio=poisson_ratio,
-		rotation_deg=angle,
-		center_xy=(x0, y0)
+	_require(q=q, poisson_ratio=poisson_ratio, width_b=B, x0=x0, y0=y0, angle=angle,
+		const_val=const_val, nx=nx, ny=ny)
+	key = (plane, nx, ny, *_plane_key(plane, xmin, xmax, ymin, ymax, zmin, zmax),
+		*_round_key(const_val, B, q, poisson_ratio, angle, x0, y0))
+	h_vals, v_vals, sig_z, sig_x, sig_y, tau_xz = _strip_heat_field(
+		key, plane, nx, ny, const_val, xmin, xmax, ymin, ymax, zmin, zmax, B, q, poisson_ratio, angle, x0, y0,
 	)
+	grid_shape = (v_vals.size, h_vals.size)
 
-	# Select component
-	series_map = {
-		"sigma_z": (sig_z, "σz"),
-		"sigma_x": (sig_x, "σx"),
-		"sigma_y": (sig_y, "σy"),
-		"tau_xz": (tau_xz, "τxz"),
+	data = {
+		"plane": plane,
+		# Point coordinates are rebuilt from the axes on download
+		"const": const_val,
+		"h": _encode_array(h_vals, dtype=np.float64),
+		"v": _encode_array(v_vals, dtype=np.float64),
+		"sigma_z": _encode_array(sig_z),
+		"sigma_x": _encode_array(sig_x),
+		"sigma_y": _encode_array(sig_y),
+		"tau_xz": _encode_array(tau_xz),
+		"shape": list(grid_shape),
 	}
-	arr, label = series_map.get(heat_component, (sig_z, "σz"))
-	S = arr.reshape(X.shape)
+	return data
 
-	if plane == "xy":
-		x_vals = X[0, :]
-		y_vals = Y[:, 0]
-		layout = dict(xaxis_title="x", yaxis_title="y", title=f"{label} on XY plane at z={const_val}")
-	elif plane == "xz":
-		x_vals = X[0, :]
-		y_vals = Z[:, 0]
-		layout = dict(xaxis_title="x", yaxis_title="z", title=f"{label} on XZ plane at y={const_val}")
-	else:
-		x_vals = Y[0, :]
-		y_vals = Z[:, 0]
-		layout = dict(xaxis_title="y", yaxis_title="z", title=f"{label} on YZ plane at x={const_val}")
 
-	if heat_display == "isobar":
-		try:
-			nc = int(n_isobars) if n_isobars and int(n_isobars) > 0 else 15
-		except Exception:
-			nc = 15
-		trace = go.Contour(x=x_vals, y=y_vals, z=S, ncontours=nc, contours=dict(coloring="lines", showlabels=True, labelfont=dict(size=10, color="black")), line=dict(width=1.2, color="black"), showscale=False, name=label)
-	else:
-		trace = go.Heatmap(x=x_vals, y=y_vals, z=S, colorscale="Viridis", colorbar_title=label)
+@app.callback(
+	Output("heat_fig", "figure"),
+	Input("heat_component", "value"),
+	Input("heat_display", "value"),
+	Input("n_isobars", "value"),
+	Input("heat_store", "data"),
+	prevent_initial_call=True,
+)
+def update_heat_fig(heat_component: str, heat_display: str, n_isobars: int, data: dict):
+	if not data:
+		raise PreventUpdate
+	n_isobars = max(_ints(n_isobars, default=15)[0], 0) or 15
+	key = heat_component if heat_component in STRIP_LABELS else "sigma_z"
+	# Stored as float32 (half the JSON payload of float64)
+	S = _decode_array(data[key]).reshape(data["shape"])
+	if ctx.triggered_id == "heat_component":
+		return _plane_heat_patch(data["plane"], data["const"], S, STRIP_LABELS[key])
+	return _plane_heat_figure(
+		data["plane"], data["const"], _decode_array(data["h"]), _decode_array(data["v"]),
+		S, STRIP_LABELS[key], heat_display, n_isobars,
+	)
 
-	fig = go.Figure(data=[trace])
-	# Show z=0 at top and deeper z at bottom for XZ and YZ
-	yaxis_settings = dict(constrain="domain")
-	if plane in ("xz", "yz"):
-		yaxis_settings["autorange"] = "reversed"
-	fig.update_layout(
-		template="plotly_white",
-		font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif", size=13),
-		margin=dict(l=60, r=20, t=50, b=50),
-		height=520,
-		hovermode="closest",
-		plot_bgcolor="#ffffff",
-		paper_bgcolor="#ffffff",
-		dragmode="pan",
-		xaxis=dict(constrain="domain"),
-		yaxis=yaxis_settings,
-		**layout,
+
+# ---------- Callbacks (circle) ----------
+@_inline_memo
+def _circle_line_field(
+	q: float,
+	a: float,
+	x0: float,
+	y0: float,
+	lx0: float,
+	ly0: float,
+	lz0: float,
+	lx1: float,
+	ly1: float,
+	lz1: float,
+) -> Tuple[np.ndarray, ...]:
+	"""Circular-footing stresses along a line, memoised (see _inline_memo); read-only (points, sigma_z, tau_rz)."""
+	points = generate_line_points([lx0, ly0, lz0], [lx1, ly1, lz1], 200)
+	# Compute stresses (sigma_r and sigma_theta removed)
+	field = (points,) + integrate_circular_stress_full(
+		points, radius_a=a, uniform_pressure_q=q, center_xy=(x0, y0)
 	)
-	# Remove draw tools from modebar
+	for arr in field:
+		arr.setflags(write=False)
+	return field
 
-	data = {
-		"plane": plane,
-		"x": pts[:, 0].tolist(),
-		"y": pts[:, 1].tolist(),
-		"z": pts[:, 2].tolist(),
-		"sigma_z": sig_z.tolist(),
-		"sigma_x": sig_x.tolist(),
-		"sigma_y": sig_y.tolist(),
-		"tau_xz": tau_xz.tolist(),
-		"shape": list(X.shape),
-	}
-	return fig, data
+
+@_inline_memo
+def _circle_heat_field(
+	plane: str,
+	nx: int,
+	ny: int,
+	const_val: float,
+	xmin: float,
+	xmax: float,
+	ymin: float,
+	ymax: float,
+	zmin: float,
+	zmax: float,
+	q: float,
+	a: float,
+	x0: float,
+	y0: float,
+) -> Tuple[np.ndarray, ...]:
+	"""Circular-footing stresses on a plane slice, memoised so repeat clicks are free (see _inline_memo).
+
+	Returns read-only (h_vals, v_vals, sigma_z, tau_rz); stresses are flat (ny*nx,).
+	"""
+	h_vals, v_vals = generate_plane_axes(plane, (xmin, xmax), (ymin, ymax), nx, ny, z_bounds=(zmin, zmax))
+	pts = plane_points(plane, const_val, h_vals, v_vals)
+	# Compute stresses (sigma_r and sigma_theta removed)
+	field = (h_vals, v_vals) + integrate_circular_stress_full(
+		pts, radius_a=a, uniform_pressure_q=q, center_xy=(x0, y0)
+	)
+	for arr in field:
+		arr.setflags(write=False)
+	return field
 
 
-# ---------- Callbacks (circle) ----------
 @app.callback(
-	Output("line_fig_c", "figure"),
 	Output("line_store_c", "data"),
 	Input("btn_line_c", "n_clicks"),
 	State("q_c", "value"),
@@ -994,11 +1297,11 @@ def update_heat_fig(
 	State("lx1_c", "value"),
 	State("ly1_c", "value"),
 	State("lz1_c", "value"),
-	State("line_component_c", "value"),
 	prevent_initial_call=True,
+	**_background("btn_line_c"),
 )
 
-def update_line_fig_c(
+def update_line_store_c(
 	_n_clicks: int,
 	q: float,
 	a: float,
@@ -1010,39 +1313,56 @@ def update_line_fig_c(
 	lx1: float,
 	ly1: float,
 	lz1: float,
-	line_component: str,
 ):
-	points = generate_line_points([lx0, ly0, lz0], [lx1, ly1, lz1], 200)
-	# Compute stresses (sigma_r and sigma_theta removed)
-	sig_z, tau_rz = integrate_circular_stress_full(points, radius_a=a, uniform_pressure_q=q, center_xy=(x0, y0))
-	dists = np.linalg.norm(points - points[0], axis=1)
-	series_map = {
-		"sigma_z": (sig_z, "σz"),
-		"tau_rz": (tau_rz, "τrz"),
+	_require(q_c=q, radius_a=a, x0_c=x0, y0_c=y0, lx0_c=lx0, ly0_c=ly0, lz0_c=lz0,
+		lx1_c=lx1, ly1_c=ly1, lz1_c=lz1)
+	points, sig_z, tau_rz = _circle_line_field(
+		_round_key(q, a, x0, y0, lx0, ly0, lz0, lx1, ly1, lz1),
+		q, a, x0, y0, lx0, ly0, lz0, lx1, ly1, lz1,
+	)
+	dists = np.linspace(0.0, math.dist((lx0, ly0, lz0), (lx1, ly1, lz1)), points.shape[0])
+	data = {
+		"s": _encode_array(dists, dtype=np.float64),
+		"x": _encode_array(points[:, 0], dtype=np.float64),
+		"y": _encode_array(points[:, 1], dtype=np.float64),
+		"z": _encode_array(points[:, 2], dtype=np.float64),
+		"sigma_z": _encode_array(sig_z),
+		"tau_rz": _encode_array(tau_rz),
 	}
-	y_vals, label = series_map.get(line_component, (sig_z, "σz"))
+	return data
+
+
+@app.callback(
+	Output("line_fig_c", "figure"),
+	Input("line_component_c", "value"),
+	Input("line_store_c", "data"),
+	prevent_initial_call=True,
+)
+def update_line_fig_c(line_component: str, data: dict):
+	if not data:
+		raise PreventUpdate
+	key = line_component if line_component in CIRCLE_LABELS else "sigma_z"
+	label = CIRCLE_LABELS[key]
+	title = f"{label} along 3D path (Circular)"
+	y_vals = _decode_array(data[key])
+	if ctx.triggered_id == "line_component_c":
+		p = Patch()
+		p["data"][0]["y"] = y_vals
+		p["data"][0]["name"] = label
+		p["layout"]["title"]["text"] = title
+		p["layout"]["yaxis"]["title"]["text"] = label
+		return p
 	fig = go.Figure()
-	fig.add_trace(go.Scatter(x=dists, y=y_vals, mode="lines", name=label))
-	fig.update_layout(template="plotly_white", title=f"{label} along 3D path (Circular)", xaxis_title="Path length s", yaxis_title=label)
+	fig.add_trace(go.Scatter(x=_decode_array(data["s"]), y=y_vals, mode="lines", name=label))
+	fig.update_layout(title=title, xaxis_title="Path length s", yaxis_title=label)
 	# Remove draw tools from modebar
-	data = {
-		"s": dists.tolist(),
-		"x": points[:, 0].tolist(),
-		"y": points[:, 1].tolist(),
-		"z": points[:, 2].tolist(),
-		"sigma_z": sig_z.tolist(),
-		"tau_rz": tau_rz.tolist(),
-	}
-	return fig, data
+	return fig
 
 
 @app.callback(
-	Output("heat_fig_c", "figure"),
 	Output("heat_store_c", "data"),
 	Input("btn_heat_c", "n_clicks"),
-	Input("heat_display_c", "value"),
-	State("n_isobars_c", "value"),
-    State("q_c", "value"),
+	State("q_c", "value"),
 	State("radius_a", "value"),
 	State("x0_c", "value"),
 	State("y0_c", "value"),
@@ -1056,13 +1376,12 @@ def update_line_fig_c(
 	State("zmax_c", "value"),
 	State("nx_c", "value"),
 	State("ny_c", "value"),
-	State("heat_component_c", "value"),
 	prevent_initial_call=True,
+	**_background("btn_heat_c"),
 )
 
-def update_heat_fig_c(
-	_n_clicks: int, heat_display: str,
-	n_isobars_c: int,
+def update_heat_store_c(
+	_n_clicks: int,
 	q: float,
 	a: float,
 	x0: float,
@@ -1077,77 +1396,62 @@ def update_heat_fig_c(
 	zmax: float,
 	nx: int,
 	ny: int,
-	heat_component: str,
 ):
+	nx, ny = _ints(nx, ny)
 	plane = plane.lower()
-	if plane == "xy":
-		X, Y, Z = generate_plane_grid("xy", const_val, (xmin, xmax), (ymin, ymax), int(nx), int(ny))
-	elif plane == "xz":
-		X, Y, Z = generate_plane_grid("xz", const_val, (xmin, xmax), (zmin, zmax), int(nx), int(ny), z_bounds=(zmin, zmax))
-	else:
-		# For 'yz': third arg is x_bounds (unused), fourth is y_bounds
-		X, Y, Z = generate_plane_grid("yz", const_val, (0, 0), (ymin, ymax), int(nx), int(ny), z_bounds=(zmin, zmax))
+	_require(q_c=q, radius_a=a, x0_c=x0, y0_c=y0, const_val_c=const_val, nx_c=nx, ny_c=ny)
+	key = (plane, nx, ny, *_plane_key(plane, xmin, xmax, ymin, ymax, zmin, zmax),
+		*_round_key(const_val, q, a, x0, y0))
+	x_vals, y_vals, sig_z, tau_rz = _circle_heat_field(
+		key, plane, nx, ny, const_val, xmin, xmax, ymin, ymax, zmin, zmax, q, a, x0, y0,
+	)
 
-	pts = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
-	# Compute stresses (sigma_r and sigma_theta removed)
-	sig_z, tau_rz = integrate_circular_stress_full(pts, radius_a=a, uniform_pressure_q=q, center_xy=(x0, y0))
-	series_map = {
-		"sigma_z": (sig_z, "σz"),
-		"tau_rz": (tau_rz, "τrz"),
+	data = {
+		"plane": plane,
+		# Point coordinates are rebuilt from the axes on download
+		"const": const_val,
+		"h": _encode_array(x_vals, dtype=np.float64),
+		"v": _encode_array(y_vals, dtype=np.float64),
+		"sigma_z": _encode_array(sig_z),
+		"tau_rz": _encode_array(tau_rz),
+		"shape": [y_vals.size, x_vals.size],
+		# Labels and titles per component for the clientside component switch
+		"labels": CIRCLE_LABELS,
+		"titles": {k: _plane_heat_title(plane, const_val, v) for k, v in CIRCLE_LABELS.items()},
 	}
-	arr, label = series_map.get(heat_component, (sig_z, "σz"))
-	S = arr.reshape(X.shape)
-
-	if plane == "xy":
-		x_vals = X[0, :]
-		y_vals = Y[:, 0]
-		layout = dict(xaxis_title="x", yaxis_title="y", title=f"{label} on XY plane at z={const_val}")
-	elif plane == "xz":
-		x_vals = X[0, :]
-		y_vals = Z[:, 0]
-		layout = dict(xaxis_title="x", yaxis_title="z", title=f"{label} on XZ plane at y={const_val}")
-	else:
-		x_vals = Y[0, :]
-		y_vals = Z[:, 0]
-		layout = dict(xaxis_title="y", yaxis_title="z", title=f"{label} on YZ plane at x={const_val}")
+	return data
 
-	if heat_display == "isobar":
-		try:
-			nc = int(n_isobars_c) if n_isobars_c and int(n_isobars_c) > 0 else 15
-		except Exception:
-			nc = 15
-		trace = go.Contour(x=x_vals, y=y_vals, z=S, ncontours=nc, contours=dict(coloring="lines", showlabels=True, labelfont=dict(size=10, color="black")), line=dict(width=1.2, color="black"), showscale=False, name=label)
-	else:
-		trace = go.Heatmap(x=x_vals, y=y_vals, z=S, colorscale="Viridis", colorbar_title=label)
 
-	fig = go.Figure(data=[trace])
-	# Show z=0 at top and deeper z at bottom for XZ and YZ
-	yaxis_settings_c = dict(constrain="domain")
-	if plane in ("xz", "yz"):
-		yaxis_settings_c["autorange"] = "reversed"
-	fig.update_layout(
-		template="plotly_white",
-		font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif", size=13),
-		margin=dict(l=60, r=20, t=50, b=50),
-		height=520,
-		hovermode="closest",
-		plot_bgcolor="#ffffff",
-		paper_bgcolor="#ffffff",
-		xaxis=dict(constrain="domain"),
-		yaxis=yaxis_settings_c,
-		dragmode="pan",
-		**layout,
+@app.callback(
+	Output("heat_fig_c", "figure"),
+	Input("heat_display_c", "value"),
+	Input("n_isobars_c", "value"),
+	Input("heat_store_c", "data"),
+	State("heat_component_c", "value"),
+	prevent_initial_call=True,
+)
+def update_heat_fig_c(heat_display: str, n_isobars_c: int, data: dict, heat_component: str):
+	if not data:
+		raise PreventUpdate
+	n_isobars_c = max(_ints(n_isobars_c, default=15)[0], 0) or 15
+	key = heat_component if heat_component in CIRCLE_LABELS else "sigma_z"
+	S = _decode_array(data[key]).reshape(data["shape"])
+	return _plane_heat_figure(
+		data["plane"], data["const"], _decode_array(data["h"]), _decode_array(data["v"]),
+		S, CIRCLE_LABELS[key], heat_display, n_isobars_c,
 	)
-	data = {
-		"plane": plane,
-		"x": pts[:, 0].tolist(),
-		"y": pts[:, 1].tolist(),
-		"z": pts[:, 2].tolist(),
-		"sigma_z": sig_z.tolist(),
-		"tau_rz": tau_rz.tolist(),
-		"shape": list(X.shape),
-	}
-	return fig, data
+
+
+# Component switches only swap the z-matrix, which the browser does from the store
+# (assets/heatmap.js) without a server round trip
+app.clientside_callback(
+	ClientsideFunction(namespace="bouss", function_name="swapHeatComponent"),
+	Output("heat_fig_c", "figure", allow_duplicate=True),
+	Input("heat_component_c", "value"),
+	State("heat_store_c", "data"),
+	State("heat_fig_c", "figure"),
+	prevent_initial_call=True,
+)
 
 
 # ---------- Callback (trapezoidal load) ----------
@@ -1172,51 +1476,53 @@ def update_trap_line_fig(_n_clicks: int, a1: float, a2: float, b: float, q: floa
 	if not _n_clicks:
 		raise PreventUpdate
 	points = generate_line_points([lx0, ly0, lz0], [lx1, ly1, lz1], 200)
-	x = points[:, 0]
-	z = points[:, 2]
-	# Avoid division by zero for z
-	z_safe = np.where(z == 0, np.finfo(float).eps, z)
-	# Angles using arctan differences (safe z denominator)
-	alpha1 = np.arctan(((-b) - x) / z_safe) - np.arctan(((-a1 - b) - x) / z_safe)
-	alpha2 = np.arctan(( b   - x) / z_safe) - np.arctan(((-b)      - x) / z_safe)
-	alpha3 = np.arctan(((b+a2) - x) / z_safe) - np.arctan(( b       - x) / z_safe)
-	# sigma_z expression; guard a1,a2
-	a1_safe = a1 if a1 != 0 else np.finfo(float).eps
-	a2_safe = a2 if a2 != 0 else np.finfo(float).eps
-	term = (alpha1 + alpha2 + alpha3) \
-		+ (b / a1_safe) * (alpha1 + (a1_safe * alpha3 / a2_safe)) \
-		+ (x / a1_safe) * (alpha1 - (a1_safe * alpha3 / a2_safe))
-	sig_z = (q / math.pi) * term
+	sig_z = trapezoid_sigma_z(points[:, 0], points[:, 2], a1, a2, b, q)
 	# Distance along line
-	dists = np.linalg.norm(points - points[0], axis=1)
+	dists = np.linspace(0.0, math.dist((lx0, ly0, lz0), (lx1, ly1, lz1)), points.shape[0])
 	fig = go.Figure()
 	fig.add_trace(go.Scatter(x=dists, y=sig_z, mode="lines", name="σz"))
 	fig.update_layout(
-		template="plotly_white",
 		title="σz along 3D path (Trapezoid)",
 		xaxis_title="Path length s",
 		yaxis_title="σz (units of q)",
-		font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif", size=13),
-		margin=dict(l=60, r=20, t=50, b=50),
 		height=420,
 		hovermode="x unified",
-		plot_bgcolor="#ffffff",
-		paper_bgcolor="#ffffff",
 		showlegend=False,
-		dragmode="pan",
-		xaxis=dict(constrain="domain"),
-		yaxis=dict(constrain="domain"),
 	)
 	data = {
-		"s": dists.tolist(),
-		"x": points[:, 0].tolist(),
-		"y": points[:, 1].tolist(),
-		"z": points[:, 2].tolist(),
-		"sigma_z": sig_z.tolist(),
+		"s": _encode_array(dists, dtype=np.float64),
+		"x": _encode_array(points[:, 0], dtype=np.float64),
+		"y": _encode_array(points[:, 1], dtype=np.float64),
+		"z": _encode_array(points[:, 2], dtype=np.float64),
+		"sigma_z": _encode_array(sig_z),
 	}
 	return fig, data
 
 
+@_inline_memo
+def _trap_heat_field(
+	nx: int,
+	nz: int,
+	xmin: float,
+	xmax: float,
+	zmin: float,
+	zmax: float,
+	a1: float,
+	a2: float,
+	b: float,
+	q: float,
+) -> Tuple[np.ndarray, ...]:
+	"""Trapezoidal-load sigma_z on the XZ slice, memoised (see _inline_memo); read-only (x_vals, z_vals, S)."""
+	# XZ slice at y=0 to match plane strain; the row and column axes broadcast to (nz, nx)
+	x_vals = np.linspace(xmin, xmax, nx)
+	z_vals = np.linspace(zmin, zmax, nz)
+	S = trapezoid_sigma_z(x_vals[None, :], z_vals[:, None], a1, a2, b, q)
+	field = (x_vals, z_vals, S)
+	for arr in field:
+		arr.setflags(write=False)
+	return field
+
+
 @app.callback(
 	Output("trap_heat_fig", "figure"),
 	Output("trap_heat_store", "data"),
@@ -1234,51 +1540,35 @@ def update_trap_line_fig(_n_clicks: int, a1: float, a2: float, b: float, q: floa
 	State("trap_heat_display", "value"),
 	State("trap_n_isobars", "value"),
 	prevent_initial_call=True,
+	**_background("btn_trap_heat"),
 )
 def update_trap_heat_fig(_n_clicks: int, a1: float, a2: float, b: float, q: float,
 	xmin: float, xmax: float, zmin: float, zmax: float, nx: int, nz: int, heat_display: str, trap_n_isobars: int):
 	if not _n_clicks:
 		raise PreventUpdate
-	# Create XZ grid at y=0 to match plane strain slice
-	x_vals = np.linspace(xmin, xmax, int(nx))
-	z_vals = np.linspace(zmin, zmax, int(nz))
-	X, Z = np.meshgrid(x_vals, z_vals)
-	Z_safe = np.where(Z == 0, np.finfo(float).eps, Z)
-	alpha1 = np.arctan(((-b) - X) / Z_safe) - np.arctan(((-a1 - b) - X) / Z_safe)
-	alpha2 = np.arctan(( b   - X) / Z_safe) - np.arctan(((-b)      - X) / Z_safe)
-	alpha3 = np.arctan(((b+a2) - X) / Z_safe) - np.arctan(( b       - X) / Z_safe)
-	a1_safe = a1 if a1 != 0 else np.finfo(float).eps
-	a2_safe = a2 if a2 != 0 else np.finfo(float).eps
-	term = (alpha1 + alpha2 + alpha3) \
-		+ (b / a1_safe) * (alpha1 + (a1_safe * alpha3 / a2_safe)) \
-		+ ((X) / a1_safe) * (alpha1 - (a1_safe * alpha3 / a2_safe))
-	S = (q / math.pi) * term
+	nx, nz = _ints(nx, nz)
+	trap_n_isobars = max(_ints(trap_n_isobars, default=15)[0], 0) or 15
+	_require(trap_a1=a1, trap_a2=a2, trap_b=b, trap_q=q, trap_xmin=xmin, trap_xmax=xmax,
+		trap_zmin=zmin, trap_zmax=zmax, trap_nx=nx, trap_nz=nz)
+	x_vals, z_vals, S = _trap_heat_field(
+		(nx, nz, *_round_key(xmin, xmax, zmin, zmax, a1, a2, b, q)), nx, nz, xmin, xmax, zmin, zmax, a1, a2, b, q,
+	)
 	if heat_display == "isobar":
-		try:
-			nc = int(trap_n_isobars) if trap_n_isobars and int(trap_n_isobars) > 0 else 15
-		except Exception:
-			nc = 15
-		trace = go.Contour(x=x_vals, y=z_vals, z=S, ncontours=nc, contours=dict(coloring="lines", showlabels=True, labelfont=dict(size=10, color="black")), line=dict(width=1.2, color="black"), showscale=False, name="σz")
+		trace = go.Contour(x=x_vals, y=z_vals, z=S, ncontours=trap_n_isobars, contours=dict(coloring="lines", showlabels=True, labelfont=dict(size=10, color="black")), line=dict(width=1.2, color="black"), showscale=False, name="σz")
 	else:
-		trace = go.Heatmap(x=x_vals, y=z_vals, z=S, colorscale="Viridis", colorbar_title="σz")
+		trace = _heatmap_trace(x_vals, z_vals, S, "σz")
 	fig = go.Figure(data=[trace])
 	fig.update_layout(
-		template="plotly_white",
-		font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif", size=13),
-		margin=dict(l=60, r=20, t=50, b=50),
 		height=520,
-		hovermode="closest",
-		plot_bgcolor="#ffffff",
-		paper_bgcolor="#ffffff",
-		dragmode="pan",
-		xaxis=dict(title="x", constrain="domain"),
-		yaxis=dict(title="z", constrain="domain", autorange="reversed"),
+		xaxis_title="x",
+		yaxis=dict(title="z", autorange="reversed"),
 	)
 	data = {
-		"x": X.ravel().tolist(),
-		"z": Z.ravel().tolist(),
-		"sigma_z": S.ravel().tolist(),
-		"shape": list(X.shape),
+		# Point coordinates are rebuilt from the axes on download
+		"h": _encode_array(x_vals, dtype=np.float64),
+		"v": _encode_array(z_vals, dtype=np.float64),
+		"sigma_z": _encode_array(S),
+		"shape": list(S.shape),
 	}
 	return fig, data
 
@@ -1292,11 +1582,8 @@ def update_trap_heat_fig(_n_clicks: int, a1: float, a2: float, b: float, q: floa
 def download_trap_line_csv(n_clicks: int, data: dict):
 	if not n_clicks or not data:
 		raise PreventUpdate
-	buf = io.StringIO()
-	buf.write("s,x,y,z,sigma_z\n")
-	for s, x, y, z, sz in zip(data["s"], data["x"], data["y"], data["z"], data["sigma_z"]):
-		buf.write(f"{s},{x},{y},{z},{sz}\n")
-	return dcc.send_string(buf.getvalue(), "trap_line_profile.csv")
+	csv = _csv_string("s,x,y,z,sigma_z", *(_decode_array(data[k]) for k in ("s", "x", "y", "z", "sigma_z")))
+	return dcc.send_string(csv, "trap_line_profile.csv")
 
 
 @app.callback(
@@ -1308,11 +1595,9 @@ def download_trap_line_csv(n_clicks: int, data: dict):
 def download_trap_heat_csv(n_clicks: int, data: dict):
 	if not n_clicks or not data:
 		raise PreventUpdate
-	buf = io.StringIO()
-	buf.write("x,z,sigma_z\n")
-	for x, z, sz in zip(data["x"], data["z"], data["sigma_z"]):
-		buf.write(f"{x},{z},{sz}\n")
-	return dcc.send_string(buf.getvalue(), "trap_heatmap_points.csv")
+	xs, _, zs = plane_coordinates("xz", 0.0, _decode_array(data["h"]), _decode_array(data["v"]))
+	csv = _csv_string("x,z,sigma_z", xs, zs, _decode_array(data["sigma_z"]).ravel())
+	return dcc.send_string(csv, "trap_heatmap_points.csv")
 
 
 @app.callback(
@@ -1324,11 +1609,9 @@ def download_trap_heat_csv(n_clicks: int, data: dict):
 def download_line_csv(n_clicks: int, data: dict):
     if not n_clicks or not data:
         raise PreventUpdate
-    buf = io.StringIO()
-    buf.write("s,x,y,z,sigma_z,sigma_x,sigma_y,tau_xz\n")
-    for s, x, y, z, sz, sx, sy, txz in zip(data["s"], data["x"], data["y"], data["z"], data["sigma_z"], data["sigma_x"], data["sigma_y"], data["tau_xz"]):
-        buf.write(f"{s},{x},{y},{z},{sz},{sx},{sy},{txz}\n")
-    return dcc.send_string(buf.getvalue(), "line_profile.csv")
+    keys = ("s", "x", "y", "z", "sigma_z", "sigma_x", "sigma_y", "tau_xz")
+    csv = _csv_string(",".join(keys), *(_decode_array(data[k]) for k in keys))
+    return dcc.send_string(csv, "line_profile.csv")
 
 
 @app.callback(
@@ -1340,11 +1623,10 @@ def download_line_csv(n_clicks: int, data: dict):
 def download_heat_csv(n_clicks: int, data: dict):
     if not n_clicks or not data:
         raise PreventUpdate
-    buf = io.StringIO()
-    buf.write("x,y,z,sigma_z,sigma_x,sigma_y,tau_xz\n")
-    for x, y, z, sz, sx, sy, txz in zip(data["x"], data["y"], data["z"], data["sigma_z"], data["sigma_x"], data["sigma_y"], data["tau_xz"]):
-        buf.write(f"{x},{y},{z},{sz},{sx},{sy},{txz}\n")
-    return dcc.send_string(buf.getvalue(), "heatmap_points.csv")
+    xs, ys, zs = plane_coordinates(data["plane"], data["const"], _decode_array(data["h"]), _decode_array(data["v"]))
+    comps = [_decode_array(data[k]).ravel() for k in ("sigma_z", "sigma_x", "sigma_y", "tau_xz")]
+    csv = _csv_string("x,y,z,sigma_z,sigma_x,sigma_y,tau_xz", xs, ys, zs, *comps)
+    return dcc.send_string(csv, "heatmap_points.csv")
 
 
 @app.callback(
@@ -1356,15 +1638,10 @@ def download_heat_csv(n_clicks: int, data: dict):
 def download_line_csv_circle(n_clicks: int, data: dict):
     if not n_clicks or not data:
         raise PreventUpdate
-    buf = io.StringIO()
     # Include available circular components (sigma_r and sigma_theta removed)
-    buf.write("s,x,y,z,sigma_z,tau_rz\n")
-    for s, x, y, z, sz, trz in zip(
-        data["s"], data["x"], data["y"], data["z"],
-        data["sigma_z"], data["tau_rz"]
-    ):
-        buf.write(f"{s},{x},{y},{z},{sz},{trz}\n")
-    return dcc.send_string(buf.getvalue(), "circle_line_profile.csv")
+    keys = ("s", "x", "y", "z", "sigma_z", "tau_rz")
+    csv = _csv_string(",".join(keys), *(_decode_array(data[k]) for k in keys))
+    return dcc.send_string(csv, "circle_line_profile.csv")
 
 
 @app.callback(
@@ -1376,14 +1653,10 @@ def download_line_csv_circle(n_clicks: int, data: dict):
 def download_heat_csv_circle(n_clicks: int, data: dict):
     if not n_clicks or not data:
         raise PreventUpdate
-    buf = io.StringIO()
-    buf.write("x,y,z,sigma_z,tau_rz\n")
-    for x, y, z, sz, trz in zip(
-        data["x"], data["y"], data["z"],
-        data["sigma_z"], data["tau_rz"]
-    ):
-        buf.write(f"{x},{y},{z},{sz},{trz}\n")
-    return dcc.send_string(buf.getvalue(), "circle_heatmap_points.csv")
+    xs, ys, zs = plane_coordinates(data["plane"], data["const"], _decode_array(data["h"]), _decode_array(data["v"]))
+    comps = [_decode_array(data[k]).ravel() for k in ("sigma_z", "tau_rz")]
+    csv = _csv_string("x,y,z,sigma_z,tau_rz", xs, ys, zs, *comps)
+    return dcc.send_string(csv, "circle_heatmap_points.csv")
 
 
 # Theme and modal callbacks
@@ -0,0 +1,45 @@
+// Clientside heatmap helpers (loaded automatically from assets/ by Dash)
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+  bouss: {
+    // Inverse of app._encode_array: base64 raw bytes -> row arrays of the stored shape
+    decodeRows: function (payload, shape) {
+      const bin = atob(payload.b64);
+      const bytes = new Uint8Array(bin.length);
+      for (let i = 0; i < bin.length; i++) {
+        bytes[i] = bin.charCodeAt(i);
+      }
+      const flat = payload.dtype.endsWith("f8")
+        ? new Float64Array(bytes.buffer)
+        : new Float32Array(bytes.buffer);
+      const nx = shape[1];
+      const rows = new Array(shape[0]);
+      for (let j = 0; j < shape[0]; j++) {
+        rows[j] = Array.from(flat.subarray(j * nx, (j + 1) * nx));
+      }
+      return rows;
+    },
+
+    // Component switch on the circle heatmap: swap the z-matrix and labels of the
+    // current figure in the browser, without a server round trip
+    swapHeatComponent: function (component, data, figure) {
+      const nu = window.dash_clientside.no_update;
+      if (!data || !figure || !figure.data || !figure.data.length) {
+        return nu;
+      }
+      const key = component in data.labels ? component : "sigma_z";
+      const label = data.labels[key];
+      const old = figure.data[0];
+      const trace = Object.assign({}, old, {
+        z: window.dash_clientside.bouss.decodeRows(data[key], data.shape),
+        name: label,
+        colorbar: Object.assign({}, old.colorbar, {
+          title: Object.assign({}, old.colorbar && old.colorbar.title, { text: label }),
+        }),
+      });
+      const layout = Object.assign({}, figure.layout, {
+        title: Object.assign({}, figure.layout && figure.layout.title, { text: data.titles[key] }),
+      });
+      return Object.assign({}, figure, { data: [trace].concat(figure.data.slice(1)), layout: layout });
+    },
+  },
+});
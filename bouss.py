@@ -1,23 +1,56 @@
 """
-Boussinesq vertical stress beneath a uniformly loaded rectangular (strip) area.
+Boussinesq stresses beneath uniformly loaded strip, circular and trapezoidal footings.
 
-We compute the stress via Gaussian quadrature integration of the Boussinesq point-load kernel:
-  sigma_z = q ∬ K(x - s, y - t, z) ds dt
-  with K(dx, dy, z) = 3 z^3 / (2π (dx^2 + dy^2 + z^2)^(5/2))
+- Strip (infinite, plane strain): closed-form angle expressions (`strip_stresses`).
+- Circular: the Boussinesq point-load kernel integrated over the loaded disk in polar
+  coordinates, with adaptive Gauss-Kronrod (21/10) panels for sigma_z and tau_rz
+  (`integrate_circular_stress_full`) or a fixed Simpson rule for sigma_z
+  (`integrate_circular_sigma_z`):
+    sigma_z = q ∬ K(x - s, y - t, z) ds dt
+    with K(dx, dy, z) = 3 z^3 / (2π (dx^2 + dy^2 + z^2)^(5/2))
+- Trapezoid (embankment, plane strain): closed form for sigma_z (`trapezoid_sigma_z`).
 
-The rectangle is centered at `center_xy` and rotated by `rotation_deg` about +z.
 Depth z is positive downward, surface at z = 0.
-
-This approach is robust and accurate for interactive usage (n_gauss ~ 12-20).
 """
 
 from __future__ import annotations
 
 import math
-from typing import Iterable, Tuple
+import os
+import threading
+import warnings
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
 
 import numpy as np
 
+try:
+	import numba
+except ImportError:  # numba is optional; NumPy paths are used without it
+	numba = None
+
+if numba is not None and "NUMBA_THREADING_LAYER" not in os.environ:
+	# The app forks after these kernels are loaded (gunicorn --preload workers, diskcache
+	# background jobs). Of numba's threading layers only workqueue survives that: GNU OpenMP
+	# aborts the child on its first parallel loop and TBB hangs it at exit. Workqueue is not
+	# thread-safe, so parallel kernels are launched under _PARALLEL_LOCK.
+	numba.config.THREADING_LAYER = "workqueue"
+
+# Serializes parallel kernel launches across server threads (each launch uses every core anyway)
+_PARALLEL_LOCK = threading.Lock()
+
+try:
+	# Optional AOT build of the strip kernel (`cythonize -i _strip.pyx`)
+	from _strip import strip_stresses as _strip_kernel_cython
+except ImportError:
+	_strip_kernel_cython = None
+
+try:
+	# Optional AOT build of the circular and trapezoid loops (`python build_kernels.py`)
+	import bouss_kernels as _aot_kernels
+except ImportError:
+	_aot_kernels = None
+
 
 PI = math.pi
 TWOPI = 2.0 * PI
@@ -27,21 +60,444 @@ def _deg_to_rad(angle_deg: float) -> float:
 	return angle_deg * PI / 180.0
 
 
-def _rotate_points_xy(points_xy: np.ndarray, rotation_deg: float) -> np.ndarray:
-	"""Rotate 2D points in the xy-plane by rotation_deg about origin.
+@lru_cache(maxsize=None)
+def _simpson_rule(n: int) -> Tuple[np.ndarray, np.ndarray]:
+	"""Composite Simpson nodes and weights on the reference interval [0, 1] (n odd, >= 3).
+
+	Callers map to [0, L] with nodes * L and weights * L. Arrays are read-only (shared).
+	"""
+	nodes = np.linspace(0.0, 1.0, n)
+	weights = np.ones(n)
+	weights[1:-1:2] = 4.0
+	weights[2:-2:2] = 2.0
+	weights /= 3.0 * (n - 1)
+	nodes.setflags(write=False)
+	weights.setflags(write=False)
+	return nodes, weights
+
+
+# Precompute the rules used by integrate_circular_sigma_z (defaults and adaptive caps)
+for _n in (25, 31, 41, 51, 61):
+	_simpson_rule(_n)
+del _n
+
+
+@lru_cache(maxsize=32)
+def _quadrature_tables(
+	radius_a: float, n_r: int, n_theta: int, dtype: np.dtype = np.dtype(np.float64),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Flattened Simpson disk rule (rcos, rsin, weights) over [0, a] x [0, 2π], each (n_r*n_theta,).
 
-	points_xy: array of shape (..., 2)
-	returns rotated array of same shape
+	Weights include the polar jacobian ρ and the Boussinesq constant 3/2π. Tables are built in
+	float64 and cast to `dtype`; arrays are read-only (shared between calls with the same key).
 	"""
+	ref_r, ref_wr = _simpson_rule(n_r)
+	ref_t, ref_wt = _simpson_rule(n_theta)
+	r_nodes = radius_a * ref_r
+	theta_nodes = TWOPI * ref_t
+	rcos = (r_nodes[:, None] * np.cos(theta_nodes)[None, :]).ravel()
+	rsin = (r_nodes[:, None] * np.sin(theta_nodes)[None, :]).ravel()
+	weights = ((3.0 / TWOPI) * radius_a * ref_wr * r_nodes)[:, None] * (TWOPI * ref_wt)[None, :]
+	tables = tuple(arr.astype(dtype, copy=False) for arr in (rcos, rsin, weights.ravel()))
+	for arr in tables:
+		arr.setflags(write=False)
+	return tables
+
+
+def _gauss_kronrod_21() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Kronrod-21 nodes/weights on [0, 1] and the embedded 10-point Gauss weights.
+
+	The Gauss weights are laid out on the 21 Kronrod nodes (zero on the Kronrod-only ones), so one
+	integrand evaluation gives both estimates. Abscissae are the QUADPACK qk21 values.
+	"""
+	xgk = np.array([
+		0.995657163025808080735527280689003, 0.973906528517171720077964012084452,
+		0.930157491355708226001207180059508, 0.865063366688984510732096688423493,
+		0.780817726586416897063717578345042, 0.679409568299024406234327365114874,
+		0.562757134668604683339000099272694, 0.433395394129247190799265943165784,
+		0.294392862701460198131126603103866, 0.148874338981631210884826001129720,
+		0.0,
+	])
+	wgk = np.array([
+		0.011694638867371874278064396062192, 0.032558162307964727478818972459390,
+		0.054755896574351996031381300244580, 0.075039674810919952767043140916190,
+		0.093125454583697605535065465083366, 0.109387158802297641899210590325805,
+		0.123491976262065851077600525572126, 0.134709217311473325928054001771707,
+		0.142775938577060080797094273138717, 0.147739104901338491374841515972068,
+		0.149445554002916905664936468389821,
+	])
+	# Gauss nodes are xgk[1], xgk[3], ..., xgk[9]
+	wg = np.zeros(11)
+	wg[1:10:2] = [
+		0.066671344308688137593568809893332, 0.149451349150580593145776339657697,
+		0.219086362515982043995534934228163, 0.269266719309996355091226921569469,
+		0.295524224714752870173892994651338,
+	]
+	# Mirror the half rule onto [-1, 1], then map to [0, 1]
+	nodes = 0.5 * (1.0 + np.concatenate([-xgk, xgk[-2::-1]]))
+	w_k = 0.5 * np.concatenate([wgk, wgk[-2::-1]])
+	w_g = 0.5 * np.concatenate([wg, wg[-2::-1]])
+	for arr in (nodes, w_k, w_g):
+		arr.setflags(write=False)
+	return nodes, w_k, w_g
+
+
+_GK21_NODES, _GK21_W, _GL10_W = _gauss_kronrod_21()
+# (21, 2) weight pair: one contraction yields the Kronrod and Gauss estimates together
+_GK21_PAIR = np.stack([_GK21_W, _GL10_W], axis=1)
+_GK21_PAIR.setflags(write=False)
+
+
+def _circular_panels_numpy(
+	x: np.ndarray,
+	y: np.ndarray,
+	z: np.ndarray,
+	ux: np.ndarray,
+	uy: np.ndarray,
+	r_lo: np.ndarray,
+	h_r: np.ndarray,
+	t_lo: np.ndarray,
+	h_t: np.ndarray,
+) -> np.ndarray:
+	"""Gauss-Kronrod estimates of the (zz, rz) stress integrals over P polar panels.
+
+	(ux, uy) is each point's horizontal unit vector from the disk center, so the shear is
+	projected to tau_rz inside the integrand (zero at the axis).
+	Returns (3, 2, P) indexed [estimate, component, panel]; estimates are Kronrod-21 in both
+	axes, Gauss-10 in r, and Gauss-10 in theta (the last two only serve as error estimates).
+	"""
+	r = r_lo[:, None] + h_r[:, None] * _GK21_NODES  # (P, 21)
+	theta = t_lo[:, None] + h_t[:, None] * _GK21_NODES
+
+	xb = x[:, None, None]
+	yb = y[:, None, None]
+	zb = z[:, None, None]
+	rg = r[:, :, None]
+	# Offsets written into the (P, 21, 21) node products in place: one buffer per axis
+	dx = rg * np.cos(theta)[:, None, :]
+	np.subtract(xb, dx, out=dx)
+	dy = rg * np.sin(theta)[:, None, :]
+	np.subtract(yb, dy, out=dy)
+	R2 = dx * dx
+	R2 += dy * dy
+	R2 += zb * zb
+	# 1 / R^5 as R2*R2*sqrt(R2) inverted in place (no generic pow, one reciprocal)
+	common = np.sqrt(R2)
+	common *= R2
+	common *= R2
+	np.reciprocal(common, out=common)
+
+	# Shared factor z^2 / R^5; the two kernels differ only by z and the radial offset.
+	# C3 = 3/2π is folded into the per-panel scale below, as in the numba kernel
+	common *= zb * zb
+	K = np.empty((2,) + R2.shape)
+	np.multiply(common, zb, out=K[0])
+	dx *= ux[:, None, None]
+	dy *= uy[:, None, None]
+	dx += dy
+	np.multiply(common, dx, out=K[1])
+
+	# Angular rule pair, polar Jacobian r, radial rule pair: (2,P,21,21) -> (2,P,2,2)
+	# indexed [..., theta rule, r rule] with 0 = Kronrod-21 and 1 = Gauss-10
+	ang = (K @ _GK21_PAIR) * r[:, :, None]
+	est = np.einsum("cpik,il->cpkl", ang, _GK21_PAIR) * ((3.0 / (2.0 * PI)) * h_r * h_t)[:, None, None]
+	return np.stack([est[:, :, 0, 0], est[:, :, 0, 1], est[:, :, 1, 0]])
+
+
+def _circular_panels_loop(x, y, z, ux, uy, r_lo, h_r, t_lo, h_t, nodes, w_k, w_g, out):
+	"""Loop form of `_circular_panels_numpy`: each panel is reduced in registers (no temporaries).
+
+	Only run compiled: JIT below, or ahead of time by build_kernels.py.
+	"""
+	m = nodes.size
+	c3 = 3.0 / (2.0 * PI)
+	for p in numba.prange(x.size):
+		xb = x[p]
+		yb = y[p]
+		zb = z[p]
+		z2 = zb * zb
+		# Accumulators: Kronrod in both axes (kk), Gauss in r (kg), Gauss in theta (gk)
+		kk_z = kk_r = 0.0
+		kg_z = kg_r = 0.0
+		gk_z = gk_r = 0.0
+		for j in range(m):
+			theta = t_lo[p] + h_t[p] * nodes[j]
+			ct = math.cos(theta)
+			st = math.sin(theta)
+			rk_z = rk_r = 0.0
+			rg_z = rg_r = 0.0
+			for i in range(m):
+				r = r_lo[p] + h_r[p] * nodes[i]
+				dx = xb - r * ct
+				dy = yb - r * st
+				R2 = dx * dx + dy * dy + z2
+				# Polar Jacobian r times z^2 / R^5
+				f = r * z2 / (R2 * R2 * math.sqrt(R2))
+				d_r = dx * ux[p] + dy * uy[p]
+				fk = w_k[i] * f
+				fg = w_g[i] * f
+				rk_z += fk * zb
+				rk_r += fk * d_r
+				rg_z += fg * zb
+				rg_r += fg * d_r
+			kk_z += w_k[j] * rk_z
+			kk_r += w_k[j] * rk_r
+			kg_z += w_k[j] * rg_z
+			kg_r += w_k[j] * rg_r
+			gk_z += w_g[j] * rk_z
+			gk_r += w_g[j] * rk_r
+		scale = c3 * h_r[p] * h_t[p]
+		out[0, 0, p] = kk_z * scale
+		out[0, 1, p] = kk_r * scale
+		out[1, 0, p] = kg_z * scale
+		out[1, 1, p] = kg_r * scale
+		out[2, 0, p] = gk_z * scale
+		out[2, 1, p] = gk_r * scale
+
+
+if numba is not None:
+	_F8_RO = numba.types.Array(numba.float64, 1, "C", readonly=True)
+	_CIRCULAR_PANELS_SIG = numba.void(*([_F8_RO] * 12), numba.float64[:, :, ::1])
+
+if _aot_kernels is not None:
+	_circular_panels_njit = _aot_kernels.circular_panels
+elif numba is not None:
+	_circular_panels_njit = numba.njit(
+		_CIRCULAR_PANELS_SIG, parallel=True, fastmath=True, cache=True,
+	)(_circular_panels_loop)
+else:
+	_circular_panels_njit = None
+
+
+def _circular_panels(x, y, z, ux, uy, r_lo, h_r, t_lo, h_t) -> np.ndarray:
+	"""Dispatch to the numba panel kernel when available (same output as the NumPy version)."""
+	if _circular_panels_njit is None:
+		return _circular_panels_numpy(x, y, z, ux, uy, r_lo, h_r, t_lo, h_t)
+	out = np.empty((3, 2, x.size))
+	with _PARALLEL_LOCK:
+		_circular_panels_njit(x, y, z, ux, uy, r_lo, h_r, t_lo, h_t, _GK21_NODES, _GK21_W, _GL10_W, out)
+	return out
+
+
+
+def _strip_stresses_numpy(
+	x_all: np.ndarray,
+	y_all: np.ndarray,
+	z_all: np.ndarray,
+	width_b: float,
+	uniform_pressure_q: float,
+	poisson_ratio: float,
+	rotation_deg: float,
+	center_xy: Tuple[float, float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+	"""NumPy implementation of the strip closed form (used when numba is unavailable)."""
+	# Only the across-strip local coordinate is needed: rotate by -rotation_deg about the
+	# center with the trig factors hoisted to scalars (no (N,2) stack or matrix product)
+	cx, cy = center_xy
 	if rotation_deg == 0.0:
-		return points_xy
+		x = x_all - cx
+	else:
+		theta = _deg_to_rad(rotation_deg)
+		c = math.cos(theta)
+		s = math.sin(theta)
+		x = c * (x_all - cx) + s * (y_all - cy)
+	z = z_all
+
+	b = 0.5 * width_b
+	q_pi = uniform_pressure_q / PI
+
+	# Analytical expression for z > 0
+	# Clamp z to a small positive epsilon to capture z -> 0+ limits without overrides
+	z_epsilon = max(1e-8 * width_b, 1e-9)
+	zpos = np.maximum(z, z_epsilon)
+	# arctan2(u, z) == arctan(u / z) for z > 0, without the division
+	beta_prime_t = np.arctan2(x - b, zpos)
+	sss = np.arctan2(x + b, zpos)
+	alpha_t = sss - beta_prime_t
+	two_beta_t = alpha_t + 2.0 * beta_prime_t
+
+	# Shared intermediates, computed once for all four components
+	sin_a = np.sin(alpha_t)
+	sa_c2b = sin_a * np.cos(two_beta_t)
+
+	# All points (including z ~ 0, via clamped z) get the z > 0 expression
+	sig_z = q_pi * (alpha_t + sa_c2b)
+	sig_x = q_pi * (alpha_t - sa_c2b)
+	sig_y = poisson_ratio * sig_z
+	tau_xz = q_pi * (sin_a * np.sin(two_beta_t))
+
+	# Enforce traction boundary conditions exactly at the free surface (z -> 0+)
+	surface_mask = z_all <= z_epsilon
+	if np.any(surface_mask):
+		# Inside strip (|x| < b) -> sigma_z = q; at edge -> q/2; outside -> 0
+		surf = np.flatnonzero(surface_mask)
+		ax = np.abs(x[surf])
+		edge_tol = max(1e-6 * width_b, 1e-8)
+		sig_z[surf] = np.select(
+			[ax < b - edge_tol, np.abs(ax - b) <= edge_tol],
+			[uniform_pressure_q, 0.5 * uniform_pressure_q],
+			default=0.0,
+		)
+		# Shear and in-plane stresses vanish at the free surface
+		for arr in (sig_x, sig_y, tau_xz):
+			arr[surf] = 0.0
+
+	return sig_z, sig_x, sig_y, tau_xz
+
+
+if numba is not None and _strip_kernel_cython is None:
+	# Explicit signatures: compiled eagerly at import (and cached on disk), so no request pays
+	# the JIT cost. The float32 specialization serves the heatmap previews. Scalars arrive
+	# pre-derived in the array dtype, so the float32 loop never promotes to float64.
+	def _strip_sig(ty):
+		arr_in = numba.types.Array(ty, 1, "C", readonly=True)
+		arr_out = ty[::1]
+		return numba.void(arr_in, arr_in, arr_in, *([ty] * 10), arr_out, arr_out, arr_out, arr_out)
+
+	@numba.njit([_strip_sig(numba.float64), _strip_sig(numba.float32)], parallel=True, fastmath=True, cache=True)
+	def _strip_kernel_njit(
+		x, y, z, b, q, q_pi, nu, c, s, cx, cy, z_epsilon, edge_tol,
+		out_sz, out_sx, out_sy, out_txz,
+	):
+		"""Fused per-point strip kernel: writes all four stress components in one pass."""
+		for i in numba.prange(x.size):
+			# Local strip coordinate (rotate by -angle about the center)
+			xl = c * (x[i] - cx) + s * (y[i] - cy)
+			zi = z[i]
+			if zi <= z_epsilon:
+				# Free-surface traction limits
+				ax = abs(xl)
+				if ax < b - edge_tol:
+					out_sz[i] = q
+				elif abs(ax - b) <= edge_tol:
+					out_sz[i] = 0.5 * q
+				else:
+					out_sz[i] = 0.0
+				out_sx[i] = 0.0
+				out_sy[i] = 0.0
+				out_txz[i] = 0.0
+				continue
+			beta_prime = math.atan2(xl - b, zi)
+			alpha = math.atan2(xl + b, zi) - beta_prime
+			two_beta = alpha + beta_prime + beta_prime
+			sin_a = math.sin(alpha)
+			sa_c2b = sin_a * math.cos(two_beta)
+			sz = q_pi * (sa_c2b + alpha)
+			out_sz[i] = sz
+			out_sx[i] = q_pi * (alpha - sa_c2b)
+			out_sy[i] = nu * sz
+			out_txz[i] = q_pi * sin_a * math.sin(two_beta)
+else:
+	_strip_kernel_njit = None
+
+# Cython extension first (no JIT warm-up at all), then numba, then NumPy
+_strip_kernel = _strip_kernel_cython or _strip_kernel_njit
+
+
+def strip_stresses(
+	x: np.ndarray,
+	y: np.ndarray,
+	z: np.ndarray,
+	width_b: float,
+	uniform_pressure_q: float,
+	poisson_ratio: float = 0.3,
+	rotation_deg: float = 0.0,
+	center_xy: Tuple[float, float] = (0.0, 0.0),
+	dtype=np.float64,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+	"""Strip stresses for flat coordinate arrays x, y, z of equal length N.
+
+	Same result as `sigma_z_infinite_strip`, without packing the points into an (N,3) array.
+	Uses the compiled `_strip` extension or the numba kernel when available, NumPy otherwise.
+	`dtype=np.float32` evaluates in single precision (visual previews); the Cython build is
+	double precision only and ignores it.
+	"""
+	if width_b <= 0:
+		raise ValueError("width must be positive")
+	dtype = np.dtype(dtype)
+	if _strip_kernel_cython is not None:
+		dtype = np.dtype(np.float64)
+	x = np.ascontiguousarray(x, dtype=dtype).ravel()
+	y = np.ascontiguousarray(y, dtype=dtype).ravel()
+	z = np.ascontiguousarray(z, dtype=dtype).ravel()
+	assert x.shape == y.shape == z.shape
+	if np.any(z < 0):
+		raise ValueError("Depth z must be >= 0 (downwards)")
+
+	if _strip_kernel is None:
+		return _strip_stresses_numpy(
+			x, y, z, width_b, uniform_pressure_q, poisson_ratio, rotation_deg, center_xy
+		)
+
+	n = x.size
+	sig_z = np.empty(n, dtype=dtype)
+	sig_x = np.empty(n, dtype=dtype)
+	sig_y = np.empty(n, dtype=dtype)
+	tau_xz = np.empty(n, dtype=dtype)
 	theta = _deg_to_rad(rotation_deg)
-	c = math.cos(theta)
-	s = math.sin(theta)
-	rot = np.array([[c, -s], [s, c]], dtype=float)
-	return points_xy @ rot.T
+	cx, cy = center_xy
+	# Scalars derived once, in the array dtype
+	scalars = [
+		0.5 * width_b,
+		uniform_pressure_q,
+		uniform_pressure_q / PI,
+		poisson_ratio,
+		math.cos(theta),
+		math.sin(theta),
+		cx,
+		cy,
+		max(1e-8 * width_b, 1e-9),
+		max(1e-6 * width_b, 1e-8),
+	]
+	with _PARALLEL_LOCK:
+		_strip_kernel(
+			x, y, z,
+			*[dtype.type(v) for v in scalars],
+			sig_z, sig_x, sig_y, tau_xz,
+		)
+	return sig_z, sig_x, sig_y, tau_xz
 
 
+def strip_stresses_grid(
+	x: np.ndarray,
+	y: np.ndarray,
+	z: np.ndarray,
+	width_b: float,
+	uniform_pressure_q: float,
+	poisson_ratio: float = 0.3,
+	rotation_deg: float = 0.0,
+	center_xy: Tuple[float, float] = (0.0, 0.0),
+	dtype=np.float64,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+	"""Strip stresses for broadcastable x, y, z (e.g. a (1, nx) row, a (ny, 1) column, a scalar).
+
+	Returns read-only arrays of the broadcast shape, so plane slices need no flat point list.
+	The closed form only depends on the across-strip coordinate and z, and is evaluated on
+	their broadcast shape: an unrotated xy slice costs one row of points, not ny*nx.
+	"""
+	x = np.asarray(x, dtype=float)
+	y = np.asarray(y, dtype=float)
+	z = np.asarray(z, dtype=float)
+	shape = np.broadcast_shapes(x.shape, y.shape, z.shape)
+	cx, cy = center_xy
+	if rotation_deg == 0.0:
+		x_local = x - cx
+	else:
+		theta = _deg_to_rad(rotation_deg)
+		x_local = math.cos(theta) * (x - cx) + math.sin(theta) * (y - cy)
+	core_shape = np.broadcast_shapes(x_local.shape, z.shape)
+	x_flat = np.broadcast_to(x_local, core_shape).ravel()
+	z_flat = np.broadcast_to(z, core_shape).ravel()
+	# Already in strip-local coordinates, so y is unused (zero rotation, centered)
+	comps = strip_stresses(
+		x_flat, np.zeros_like(x_flat), z_flat,
+		width_b=width_b,
+		uniform_pressure_q=uniform_pressure_q,
+		poisson_ratio=poisson_ratio,
+		dtype=dtype,
+	)
+	return tuple(np.broadcast_to(c.reshape(core_shape), shape) for c in comps)
+
 
 def sigma_z_infinite_strip(
 	points_xyz: np.ndarray,
@@ -70,66 +526,22 @@ def sigma_z_infinite_strip(
 	  σz = 0         for |x| > b
 	  σx = σy = τxz = 0 everywhere at surface
 	"""
-	if width_b <= 0:
-		raise ValueError("width must be positive")
 	pts = np.asarray(points_xyz, dtype=float)
 	assert pts.ndim == 2 and pts.shape[1] == 3
-	shifted_xy = pts[:, :2] - np.asarray(center_xy, dtype=float)
-	local_xy = _rotate_points_xy(shifted_xy, -rotation_deg)
-	x = local_xy[:, 0]
-	z = pts[:, 2]
-	if np.any(z < 0):
-		raise ValueError("Depth z must be >= 0 (downwards)")
-
-	b = 0.5 * width_b
-	sig_z = np.empty_like(z, dtype=float)
-	sig_x = np.empty_like(z, dtype=float)
-	sig_y = np.empty_like(z, dtype=float)
-	tau_xz = np.empty_like(z, dtype=float)
-
-	# Analytical expression for z > 0
-	# Clamp z to a small positive epsilon to capture z -> 0+ limits without overrides
-	z_epsilon = max(1e-8 * width_b, 1e-9)
-	zpos = np.where(z < z_epsilon, z_epsilon, z)
-	beta_prime_t = np.arctan((x - b) / zpos)
-	sss = np.arctan((x + b) / zpos)
-	alpha_t = sss - beta_prime_t
-	beta_t = alpha_t / 2 + beta_prime_t
-
-	# Calculate all stress components
-	term_z = np.sin(alpha_t) * np.cos(2 * beta_t) + alpha_t
-	term_x = -np.sin(alpha_t) * np.cos(2 * beta_t) + alpha_t
-	term_xz = np.sin(alpha_t) * np.sin(2 * beta_t)
-
-	sig_zpos = (uniform_pressure_q / PI) * term_z
-	sig_xpos = (uniform_pressure_q / PI) * term_x
-	sig_ypos = poisson_ratio * sig_zpos
-	tau_xz_pos = (uniform_pressure_q / PI) * term_xz
-
-	# Assign for all points (including z ~ 0, via clamped z)
-	sig_z[:] = sig_zpos
-	sig_x[:] = sig_xpos
-	sig_y[:] = sig_ypos
-	tau_xz[:] = tau_xz_pos
-
-	# Enforce traction boundary conditions exactly at the free surface (z -> 0+)
-	surface_mask = pts[:, 2] <= z_epsilon
-	if np.any(surface_mask):
-		# Inside strip (|x| < b) -> sigma_z = q; at edge -> q/2; outside -> 0
-		x_all = x
-		edge_tol = max(1e-6 * width_b, 1e-8)
-		inside_mask = surface_mask & (np.abs(x_all) < b - edge_tol)
-		edge_mask = surface_mask & (np.abs(np.abs(x_all) - b) <= edge_tol)
-		outside_mask = surface_mask & (np.abs(x_all) > b + edge_tol)
-		sig_z[inside_mask] = uniform_pressure_q
-		sig_z[edge_mask] = 0.5 * uniform_pressure_q
-		sig_z[outside_mask] = 0.0
-		# Shear and in-plane stresses vanish at the free surface
-		sig_x[surface_mask] = 0.0
-		sig_y[surface_mask] = 0.0
-		tau_xz[surface_mask] = 0.0
-
-	return sig_z, sig_x, sig_y, tau_xz
+	return strip_stresses(
+		pts[:, 0], pts[:, 1], pts[:, 2],
+		width_b=width_b,
+		uniform_pressure_q=uniform_pressure_q,
+		poisson_ratio=poisson_ratio,
+		rotation_deg=rotation_deg,
+		center_xy=center_xy,
+	)
+
+
+def _circular_surface_sigma_z(r: np.ndarray, radius_a: float, q: float) -> np.ndarray:
+	"""Free-surface traction limit of sigma_z at radius r: q inside the disk, q/2 on the rim, 0 outside."""
+	edge_tol = max(1e-4 * radius_a, 1e-5)
+	return np.select([r < radius_a - edge_tol, np.abs(r - radius_a) <= edge_tol], [q, 0.5 * q], default=0.0)
 
 
 def integrate_circular_sigma_z(
@@ -139,6 +551,7 @@ def integrate_circular_sigma_z(
     center_xy: Tuple[float, float] = (0.0, 0.0),
     n_r: int = 61,
     n_theta: int = 41,
+    dtype: np.dtype = np.float64,
 ) -> np.ndarray:
 	"""Vertical stress under a uniformly loaded circular footing by explicit polar integration.
 
@@ -151,8 +564,11 @@ def integrate_circular_sigma_z(
 	- uniform_pressure_q: uniform pressure intensity
 	- center_xy: circle center translation
 	- n_r, n_theta: odd counts for Simpson integration (≥ 3)
+	- dtype: working and result precision; float32 halves the traffic of the (B,M) passes for
+	  previews, while the per-point q z^3 factor is still applied in float64
 	"""
 	pts = np.asarray(points_xyz, dtype=float)
+	dtype = np.dtype(dtype)
 	assert pts.ndim == 2 and pts.shape[1] == 3
 	if radius_a <= 0:
 		raise ValueError("radius must be positive")
@@ -183,74 +599,64 @@ def integrate_circular_sigma_z(
 	x_all = shifted_xy[:, 0]
 	y_all = shifted_xy[:, 1]
 	z_all = pts[:, 2]
-	# Clamp z for near-surface limit (avoid singularity at z = 0)
+	# Points within z_eps of the surface take the analytical z -> 0+ limit instead
 	# Chosen slightly larger epsilon for stability in dense heatmaps
 	z_eps = max(1e-6 * radius_a, 1e-6)
-	zpos_all = np.where(z_all < z_eps, z_eps, z_all)
-
-	# Simpson nodes and weights in r and theta
-	r_nodes = np.linspace(0.0, radius_a, n_r)
-	theta_nodes = np.linspace(0.0, TWOPI, n_theta)
-	wr = np.ones(n_r)
-	wr[1:-1:2] = 4.0
-	wr[2:-2:2] = 2.0
-	wt = np.ones(n_theta)
-	wt[1:-1:2] = 4.0
-	wt[2:-2:2] = 2.0
-	dr = radius_a / (n_r - 1)
-	dtheta = TWOPI / (n_theta - 1)
-	# Combine Simpson factors (Δ/3) and polar jacobian ρ
-	area_weights_2d = ((wr * dr) / 3.0)[:, None] * ((wt * dtheta) / 3.0)[None, :]  # (nr,nth)
-	area_weights_2d = area_weights_2d * r_nodes[:, None]
-
-	# Build grids for evaluation
-	r_grid = r_nodes[None, :, None]  # (1,nr,1)
-	theta_grid = theta_nodes[None, None, :]  # (1,1,nth)
-	cos_t = np.cos(theta_grid)
-	sin_t = np.sin(theta_grid)
-
-	# Batched evaluation to cap memory usage
-	num_points = pts.shape[0]
-	sigma_z = np.empty(num_points, dtype=float)
 
-	# Estimate a safe batch size to keep memory reasonable (~64MB transient)
-	arrays_per_batch = 5  # dx, dy, R2, R5, K
+	num_points = pts.shape[0]
+	sigma_z = np.empty(num_points, dtype=dtype)
+	surf = np.flatnonzero(z_all <= z_eps)
+	if surf.size:
+		# Only the subsurface points are integrated (none at all for a z = 0 plane)
+		sigma_z[surf] = _circular_surface_sigma_z(
+			np.hypot(x_all[surf], y_all[surf]), radius_a, uniform_pressure_q,
+		)
+		inner = np.flatnonzero(z_all > z_eps)
+		x_all, y_all, z_all = x_all[inner], y_all[inner], z_all[inner]
+		sigma_in = np.empty(inner.size, dtype=dtype)
+	else:
+		inner = None
+		sigma_in = sigma_z
+	num_inner = z_all.size
+	if num_inner == 0:
+		return sigma_z
+	xw_all = x_all.astype(dtype, copy=False)
+	yw_all = y_all.astype(dtype, copy=False)
+	zw_all = z_all.astype(dtype, copy=False)
+
+	# Flattened (nr,nth) disk rule, M = nr*nth nodes, so per-batch arrays are (B,M)
+	rcos_flat, rsin_flat, weights_flat = _quadrature_tables(float(radius_a), n_r, n_theta, dtype)
+
+	# Batch size so the (B,M) temporaries stay cache resident (~512KB working set); a
+	# larger budget streams every elementwise pass through DRAM and runs slower
+	arrays_per_batch = 4  # dx, dy, R2, 1/R^5
 	elems_per_point = n_r * n_theta
-	bytes_per_point = arrays_per_batch * elems_per_point * 8
-	target_bytes = 64 * 1024 * 1024
+	bytes_per_point = arrays_per_batch * elems_per_point * dtype.itemsize
+	target_bytes = 512 * 1024
 	batch_size = max(1, int(target_bytes // max(bytes_per_point, 1)))
-	batch_size = min(batch_size, num_points)
-	if batch_size <= 0:
-		batch_size = 1
-
-	for start in range(0, num_points, batch_size):
-		stop = min(start + batch_size, num_points)
-		xb = x_all[start:stop][:, None, None]
-		yb = y_all[start:stop][:, None, None]
-		zb = zpos_all[start:stop][:, None, None]
-
-		dx = xb - r_grid * cos_t  # (B,nr,nth)
-		dy = yb - r_grid * sin_t  # (B,nr,nth)
-		R2 = dx * dx + dy * dy + zb * zb
-		R5 = R2 ** 2.5
-		K = (3.0 * (zb ** 3)) / (TWOPI * R5)
-		# Weighted sum over disk for the batch
-		# Result shape: (B,)
-		sigma_z[start:stop] = uniform_pressure_q * np.tensordot(
-			K, area_weights_2d, axes=([1, 2], [0, 1])
-		)
-
-	# Near-surface analytical limit at z -> 0+
-	r_all = np.hypot(x_all, y_all)
-	surface_mask = z_all <= z_eps
-	edge_tol = max(1e-4 * radius_a, 1e-5)
-	inside_mask = surface_mask & (r_all < radius_a - edge_tol)
-	edge_mask = surface_mask & (np.abs(r_all - radius_a) <= edge_tol)
-	outside_mask = surface_mask & (r_all > radius_a + edge_tol)
-	sigma_z[inside_mask] = uniform_pressure_q
-	sigma_z[edge_mask] = 0.5 * uniform_pressure_q
-	sigma_z[outside_mask] = 0.0
-
+	batch_size = min(batch_size, num_inner)
+
+	for start in range(0, num_inner, batch_size):
+		stop = min(start + batch_size, num_inner)
+		xb = xw_all[start:stop][:, None]
+		yb = yw_all[start:stop][:, None]
+		zb = zw_all[start:stop]
+
+		dx = xb - rcos_flat  # (B,M)
+		dy = yb - rsin_flat  # (B,M)
+		R2 = dx * dx + dy * dy + (zb * zb)[:, None]
+		# 1 / R^5 as R2*R2*sqrt(R2) inverted in place (no generic pow, one reciprocal)
+		inv_R5 = np.sqrt(R2)
+		inv_R5 *= R2
+		inv_R5 *= R2
+		np.reciprocal(inv_R5, out=inv_R5)
+		# Weighted sum over the disk, with the per-point q z^3 factor applied after the
+		# contraction (no K array): (B,M) @ (M,) -> (B,)
+		z64 = z_all[start:stop]
+		sigma_in[start:stop] = (uniform_pressure_q * z64 * z64 * z64) * (inv_R5 @ weights_flat)
+
+	if inner is not None:
+		sigma_z[inner] = sigma_in
 	return sigma_z
 
 
@@ -269,6 +675,82 @@ def generate_line_points(
 	return pts
 
 
+def generate_plane_axes(
+	plane: str,
+	x_bounds: Tuple[float, float],
+	y_bounds: Tuple[float, float],
+	nx: int,
+	ny: int,
+	z_bounds: Tuple[float, float] | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+	"""1-D axis vectors (horizontal of length nx, vertical of length ny) spanning a plane.
+
+	Axes follow the same convention as `generate_plane_grid`:
+	"xy" -> (x, y), "xz" -> (x, z), "yz" -> (y, z).
+	"""
+	if nx < 2 or ny < 2:
+		raise ValueError("nx and ny must be >= 2")
+	plane = plane.lower()
+	if plane not in {"xy", "xz", "yz"}:
+		raise ValueError("plane must be 'xy', 'xz', or 'yz'")
+
+	if plane == "xy":
+		h = np.linspace(x_bounds[0], x_bounds[1], nx)
+		v = np.linspace(y_bounds[0], y_bounds[1], ny)
+	elif plane == "xz":
+		h = np.linspace(x_bounds[0], x_bounds[1], nx)
+		v = np.linspace(z_bounds[0], z_bounds[1], ny)
+	else:  # "yz"
+		h = np.linspace(y_bounds[0], y_bounds[1], nx)
+		v = np.linspace(z_bounds[0], z_bounds[1], ny)
+	return h, v
+
+
+def plane_coordinates(
+	plane: str,
+	const_value: float,
+	h_axis: np.ndarray,
+	v_axis: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Flat (x, y, z) coordinate arrays of length ny*nx for a plane given its axis vectors.
+
+	Points are ordered row-major over (ny, nx), matching `generate_plane_grid(...)[i].ravel()`,
+	so results reshape back with `.reshape(ny, nx)`.
+	"""
+	nx = h_axis.size
+	ny = v_axis.size
+	h_flat = np.tile(h_axis, ny)
+	v_flat = np.repeat(v_axis, nx)
+	c_flat = np.full(nx * ny, const_value, dtype=float)
+	plane = plane.lower()
+	if plane == "xy":
+		return h_flat, v_flat, c_flat
+	if plane == "xz":
+		return h_flat, c_flat, v_flat
+	return c_flat, h_flat, v_flat
+
+
+def plane_broadcast_coordinates(
+	plane: str,
+	const_value: float,
+	h_axis: np.ndarray,
+	v_axis: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""(x, y, z) for a plane as a (1, nx) row, a (ny, 1) column and a scalar.
+
+	They broadcast to the (ny, nx) slice without materializing it (see `strip_stresses_grid`).
+	"""
+	h_row = np.asarray(h_axis, dtype=float)[None, :]
+	v_col = np.asarray(v_axis, dtype=float)[:, None]
+	c = float(const_value)
+	plane = plane.lower()
+	if plane == "xy":
+		return h_row, v_col, c
+	if plane == "xz":
+		return h_row, c, v_col
+	return c, h_row, v_col
+
+
 def generate_plane_grid(
 	plane: str,
 	const_value: float,
@@ -285,31 +767,50 @@ def generate_plane_grid(
 	- For "xz": const_value is y, use x_bounds and z_bounds.
 	- For "yz": const_value is x, use y_bounds and z_bounds.
 
-	Returns: (X, Y, Z) each shaped (ny, nx), using numpy.meshgrid with indexing="xy".
+	Returns: (X, Y, Z) each shaped (ny, nx), laid out like numpy.meshgrid with indexing="xy".
+	They are read-only broadcast views of the axes (no dense copies); use `generate_plane_points`
+	for a flat (ny*nx, 3) point array.
 	"""
-	if nx < 2 or ny < 2:
-		raise ValueError("nx and ny must be >= 2")
-	plane = plane.lower()
-	if plane not in {"xy", "xz", "yz"}:
-		raise ValueError("plane must be 'xy', 'xz', or 'yz'")
+	h, v = generate_plane_axes(plane, x_bounds, y_bounds, nx, ny, z_bounds=z_bounds)
+	shape = (ny, nx)
+	return tuple(
+		np.broadcast_to(a, shape) for a in plane_broadcast_coordinates(plane, const_value, h, v)
+	)
 
-	if plane == "xy":
-		x = np.linspace(x_bounds[0], x_bounds[1], nx)
-		y = np.linspace(y_bounds[0], y_bounds[1], ny)
-		X, Y = np.meshgrid(x, y, indexing="xy")
-		Z = np.full_like(X, const_value, dtype=float)
-	elif plane == "xz":
-		x = np.linspace(x_bounds[0], x_bounds[1], nx)
-		z = np.linspace(z_bounds[0], z_bounds[1], ny)
-		X, Z = np.meshgrid(x, z, indexing="xy")
-		Y = np.full_like(X, const_value, dtype=float)
-	else:  # "yz"
-		y = np.linspace(y_bounds[0], y_bounds[1], nx)
-		z = np.linspace(z_bounds[0], z_bounds[1], ny)
-		Y, Z = np.meshgrid(y, z, indexing="xy")
-		X = np.full_like(Y, const_value, dtype=float)
 
-	return X, Y, Z
+def plane_points(
+	plane: str,
+	const_value: float,
+	h_axis: np.ndarray,
+	v_axis: np.ndarray,
+) -> np.ndarray:
+	"""(ny*nx, 3) points of a plane, row-major over (ny, nx) like `plane_coordinates`.
+
+	Each column is written straight from the broadcast axes (no intermediate flat copies).
+	"""
+	nx = np.size(h_axis)
+	ny = np.size(v_axis)
+	pts = np.empty((ny, nx, 3))
+	for i, a in enumerate(plane_broadcast_coordinates(plane, const_value, h_axis, v_axis)):
+		pts[:, :, i] = a
+	return pts.reshape(-1, 3)
+
+
+def generate_plane_points(
+	plane: str,
+	const_value: float,
+	x_bounds: Tuple[float, float],
+	y_bounds: Tuple[float, float],
+	nx: int,
+	ny: int,
+	z_bounds: Tuple[float, float] | None = None,
+) -> np.ndarray:
+	"""Flat (ny*nx, 3) counterpart of `generate_plane_grid` (same bounds and ordering).
+
+	Columns reshape back to the grid with `pts[:, i].reshape(ny, nx)`.
+	"""
+	h, v = generate_plane_axes(plane, x_bounds, y_bounds, nx, ny, z_bounds=z_bounds)
+	return plane_points(plane, const_value, h, v)
 
 
 def integrate_circular_stress_full(
@@ -317,39 +818,34 @@ def integrate_circular_stress_full(
 	radius_a: float,
 	uniform_pressure_q: float,
 	center_xy: Tuple[float, float] = (0.0, 0.0),
-	n_r: int = 61,
-	n_theta: int = 41,
+	n_r: Optional[int] = None,
+	n_theta: Optional[int] = None,
+	rtol: float = 1e-4,
+	max_depth: int = 10,
 ) -> Tuple[np.ndarray, np.ndarray]:
 	"""Vertical and shear stresses (sigma_z, tau_rz) under a circular footing.
 
 	Integrates the Boussinesq point-load stress tensor over the loaded disk with uniform pressure q.
-	Uses Simpson integration in polar coordinates with batching to control memory.
+	Uses adaptive Gauss-Kronrod (21/10) panels in polar coordinates: each (r, theta) panel starts as
+	the whole disk and is bisected along the axis whose 21-vs-10 estimates differ by more than
+	`rtol`, at most `max_depth` times. Deep points converge on the first panel.
 	Returns only sigma_z and tau_rz (sigma_r and sigma_theta removed).
+
+	n_r and n_theta (the node counts of the former Simpson rule) are deprecated and ignored.
 	"""
+	if n_r is not None or n_theta is not None:
+		warnings.warn(
+			"integrate_circular_stress_full: n_r and n_theta are ignored (the adaptive "
+			"Gauss-Kronrod rule sets its own nodes); use rtol and max_depth instead",
+			DeprecationWarning,
+			stacklevel=2,
+		)
 	pts = np.asarray(points_xyz, dtype=float)
 	assert pts.ndim == 2 and pts.shape[1] == 3
 	if radius_a <= 0:
 		raise ValueError("radius must be positive")
 	if np.any(pts[:, 2] < 0):
 		raise ValueError("Depth z must be >= 0 (downwards)")
-	if n_r < 3 or n_theta < 3:
-		raise ValueError("n_r and n_theta must be >= 3")
-	if n_r % 2 == 0:
-		n_r += 1
-	if n_theta % 2 == 0:
-		n_theta += 1
-
-	# Adapt nodes for large grids
-	num_points = pts.shape[0]
-	if num_points >= 10000:
-		n_r = max(3, min(n_r, 31)) | 1
-		n_theta = max(3, min(n_theta, 25)) | 1
-	elif num_points >= 4000:
-		n_r = max(3, min(n_r, 41)) | 1
-		n_theta = max(3, min(n_theta, 31)) | 1
-	elif num_points >= 1000:
-		n_r = max(3, min(n_r, 51)) | 1
-		n_theta = max(3, min(n_theta, 41)) | 1
 
 	# Local coords and clamps
 	shifted_xy = pts[:, :2] - np.asarray(center_xy, dtype=float)
@@ -357,86 +853,194 @@ def integrate_circular_stress_full(
 	y_all = shifted_xy[:, 1]
 	z_all = pts[:, 2]
 	z_eps = max(1e-6 * radius_a, 1e-6)
-	zpos_all = np.where(z_all < z_eps, z_eps, z_all)
-
-	# Simpson nodes/weights and grids
-	r_nodes = np.linspace(0.0, radius_a, n_r)
-	theta_nodes = np.linspace(0.0, TWOPI, n_theta)
-	wr = np.ones(n_r)
-	wr[1:-1:2] = 4.0
-	wr[2:-2:2] = 2.0
-	wt = np.ones(n_theta)
-	wt[1:-1:2] = 4.0
-	wt[2:-2:2] = 2.0
-	dr = radius_a / (n_r - 1)
-	dtheta = TWOPI / (n_theta - 1)
-	area_weights_2d = ((wr * dr) / 3.0)[:, None] * ((wt * dtheta) / 3.0)[None, :]
-	area_weights_2d = area_weights_2d * r_nodes[:, None]
-
-	r_grid = r_nodes[None, :, None]
-	theta_grid = theta_nodes[None, None, :]
-	cos_t = np.cos(theta_grid)
-	sin_t = np.sin(theta_grid)
-
-	# Outputs - only sigma_z and tau_rz components
-	sig_xz = np.empty(num_points, dtype=float)
-	sig_yz = np.empty(num_points, dtype=float)
-	sig_zz = np.empty(num_points, dtype=float)
-
-	# Batch size estimate
-	arrays_per_batch = 5  # dx, dy, R2, R5, K_zz, K_xz, K_yz
-	elems_per_point = n_r * n_theta
-	bytes_per_point = arrays_per_batch * elems_per_point * 8
-	target_bytes = 64 * 1024 * 1024
-	batch_size = max(1, int(target_bytes // max(bytes_per_point, 1)))
-	batch_size = min(batch_size, num_points)
-	if batch_size <= 0:
-		batch_size = 1
-
-	C3 = 3.0 / (2.0 * PI)
-
-	for start in range(0, num_points, batch_size):
-		stop = min(start + batch_size, num_points)
-		xb = x_all[start:stop][:, None, None]
-		yb = y_all[start:stop][:, None, None]
-		zb = zpos_all[start:stop][:, None, None]
-
-		dx = xb - r_grid * cos_t
-		dy = yb - r_grid * sin_t
-		R2 = dx * dx + dy * dy + zb * zb
-		R5 = R2 ** 2.5
-
-		K_zz = C3 * (zb ** 3) / R5
-		K_xz = C3 * dx * (zb ** 2) / R5
-		K_yz = C3 * dy * (zb ** 2) / R5
-
-		Aw = area_weights_2d
-		sig_zz[start:stop] = uniform_pressure_q * np.tensordot(K_zz, Aw, axes=([1, 2], [0, 1]))
-		sig_xz[start:stop] = uniform_pressure_q * np.tensordot(K_xz, Aw, axes=([1, 2], [0, 1]))
-		sig_yz[start:stop] = uniform_pressure_q * np.tensordot(K_yz, Aw, axes=([1, 2], [0, 1]))
-
-	# Convert to cylindrical shear stress tau_rz
-	phi = np.arctan2(y_all, x_all)
-	c = np.cos(phi)
-	s = np.sin(phi)
-	tau_rz = sig_xz * c + sig_yz * s
+	r_all = np.hypot(x_all, y_all)
+	if not np.any(z_all > z_eps):
+		# Surface plane: the traction limits are the whole answer (no queue, no dedupe)
+		return _circular_surface_sigma_z(r_all, radius_a, uniform_pressure_q), np.zeros(r_all.size)
+
+	# The load is axisymmetric: sigma_z and tau_rz depend only on (r, z). Each distinct pair
+	# (to 1e-12 a) is integrated once, at (x, y) = (r, 0), and scattered back to its points.
+	rz_key = np.round(np.column_stack([r_all, z_all]) * (1.0 / radius_a), 12)
+	_, first, inverse = np.unique(rz_key, axis=0, return_index=True, return_inverse=True)
+	r_u = r_all[first]
+	z_u = z_all[first]
+	zeros_u = np.zeros(r_u.size)
+	# Radial unit vector at (r, 0) projects the shear onto r without trig (zero on the axis,
+	# where tau_rz vanishes by symmetry)
+	ux_u = (r_u > 0.0).astype(float)
+
+	# Outputs - rows are (sigma_z, tau_rz) per distinct (r, z), before the surface limits below
+	sig_u = np.zeros((2, r_u.size), dtype=float)
+
+	# Work queue of panels [r_lo, r_hi] x [t_lo, t_hi], one row per (point, panel). Surface points
+	# are skipped: their values are fixed by the traction limits below.
+	owner = np.flatnonzero(z_u > z_eps)
+	r_lo = np.zeros(owner.size)
+	r_hi = np.full(owner.size, float(radius_a))
+	t_lo = np.zeros(owner.size)
+	t_hi = np.full(owner.size, TWOPI)
+	atol = 1e-10
+
+	# Panels per batch for the NumPy kernel, sized to a cache-resident (~1MB) working set;
+	# the numba kernel allocates no temporaries and takes the whole queue at once
+	arrays_per_batch = 6  # dx, dy, R2, common factor, stacked K (2 components)
+	elems_per_panel = _GK21_NODES.size ** 2
+	bytes_per_panel = arrays_per_batch * elems_per_panel * 8
+	target_bytes = 1024 * 1024
+	batch_size = max(1, int(target_bytes // max(bytes_per_panel, 1)))
+
+	for depth in range(max_depth + 1):
+		if owner.size == 0:
+			break
+		if _circular_panels_njit is not None:
+			batch_size = owner.size
+		split_r = np.zeros(owner.size, dtype=bool)
+		split_t = np.zeros(owner.size, dtype=bool)
+		for start in range(0, owner.size, batch_size):
+			stop = min(start + batch_size, owner.size)
+			idx = owner[start:stop]
+			h_r = r_hi[start:stop] - r_lo[start:stop]
+			h_t = t_hi[start:stop] - t_lo[start:stop]
+			est = _circular_panels(
+				r_u[idx], zeros_u[idx], z_u[idx], ux_u[idx], zeros_u[idx],
+				r_lo[start:stop], h_r, t_lo[start:stop], h_t,
+			)
+			i_kk = est[0]
+			err_r = np.abs(i_kk - est[1]).max(axis=0)
+			err_t = np.abs(i_kk - est[2]).max(axis=0)
+
+			tol = np.maximum(rtol * np.abs(i_kk).max(axis=0), atol)
+			bad = np.maximum(err_r, err_t) > tol
+			if depth == max_depth:
+				bad[:] = False
+			split_r[start:stop] = bad & (err_r >= err_t)
+			split_t[start:stop] = bad & (err_r < err_t)
+			good = ~bad
+			for comp in range(2):
+				np.add.at(sig_u[comp], idx[good], i_kk[comp, good])
+
+		# Bisect unconverged panels along the axis with the larger error estimate
+		r_mid = 0.5 * (r_lo + r_hi)
+		t_mid = 0.5 * (t_lo + t_hi)
+		owner = np.concatenate([owner[split_r], owner[split_r], owner[split_t], owner[split_t]])
+		r_lo, r_hi, t_lo, t_hi = (
+			np.concatenate([r_lo[split_r], r_mid[split_r], r_lo[split_t], r_lo[split_t]]),
+			np.concatenate([r_mid[split_r], r_hi[split_r], r_hi[split_t], r_hi[split_t]]),
+			np.concatenate([t_lo[split_r], t_lo[split_r], t_lo[split_t], t_mid[split_t]]),
+			np.concatenate([t_hi[split_r], t_hi[split_r], t_mid[split_t], t_hi[split_t]]),
+		)
+
+	sig_u *= uniform_pressure_q
+	sig_zz, tau_rz = sig_u[:, inverse.reshape(-1)]
 
 	# Near-surface limit: enforce traction boundary conditions at z=0
-	surface_mask = z_all <= z_eps
-	if np.any(surface_mask):
+	# (the gather above yields fresh arrays, so the overrides write in place)
+	surf = np.flatnonzero(z_all <= z_eps)
+	if surf.size:
 		# tau_rz must be zero at the free surface
-		tau_rz[surface_mask] = 0.0
+		tau_rz[surf] = 0.0
 		# Enforce sigma_z limits to match applied traction
-		r_all = np.hypot(x_all, y_all)
-		edge_tol = max(1e-4 * radius_a, 1e-5)
-		inside_mask = surface_mask & (r_all < radius_a - edge_tol)
-		edge_mask = surface_mask & (np.abs(r_all - radius_a) <= edge_tol)
-		outside_mask = surface_mask & (r_all > radius_a + edge_tol)
-		sigma_z = sig_zz.copy()
-		sigma_z[inside_mask] = uniform_pressure_q
-		sigma_z[edge_mask] = 0.5 * uniform_pressure_q
-		sigma_z[outside_mask] = 0.0
-	else:
-		sigma_z = sig_zz
+		sig_zz[surf] = _circular_surface_sigma_z(r_all[surf], radius_a, uniform_pressure_q)
+
+	return sig_zz, tau_rz
+
+def _trapezoid_sigma_z_numpy(
+	x: np.ndarray, z: np.ndarray, a1: float, a2: float, b: float, q: float
+) -> np.ndarray:
+	"""NumPy implementation of the trapezoid closed form (used when numba is unavailable)."""
+	z_safe = np.where(z == 0, np.finfo(float).eps, z)
+	# Four edge angles; each alpha is the angle subtended by one part of the load
+	t1 = np.arctan(((-a1 - b) - x) / z_safe)
+	t2 = np.arctan(((-b) - x) / z_safe)
+	t3 = np.arctan((b - x) / z_safe)
+	t4 = np.arctan(((b + a2) - x) / z_safe)
+	alpha1 = t2 - t1
+	alpha2 = t3 - t2
+	alpha3 = t4 - t3
+	term = alpha1 + alpha2 + alpha3
+	# Ramp terms; a ramp of zero width carries no load (and its alpha is 0)
+	if a1 != 0:
+		term = term + (b + x) * alpha1 / a1
+	if a2 != 0:
+		term = term + (b - x) * alpha3 / a2
+	return (q / PI) * term
+
+
+def _trapezoid_loop(x, z, a1, a2, b, q, out):
+	"""Fused trapezoid kernel: four atan calls per point and no temporaries (compiled only).
+
+	x and z are 2-D and may be stride-0 broadcast views, e.g. a (1, nx) row against a (nz, 1)
+	column expanded to (nz, nx), so grid callers never materialize a meshgrid.
+	"""
+	eps = 2.220446049250313e-16
+	q_pi = q / PI
+	# Zero-width ramps drop out (see _trapezoid_sigma_z_numpy)
+	inv_a1 = 1.0 / a1 if a1 != 0.0 else 0.0
+	inv_a2 = 1.0 / a2 if a2 != 0.0 else 0.0
+	for i in numba.prange(out.shape[0]):
+		for j in range(out.shape[1]):
+			xi = x[i, j]
+			zi = z[i, j] if z[i, j] != 0.0 else eps
+			t1 = math.atan(((-a1 - b) - xi) / zi)
+			t2 = math.atan(((-b) - xi) / zi)
+			t3 = math.atan((b - xi) / zi)
+			t4 = math.atan(((b + a2) - xi) / zi)
+			alpha1 = t2 - t1
+			alpha2 = t3 - t2
+			alpha3 = t4 - t3
+			out[i, j] = q_pi * ((alpha1 + alpha2 + alpha3) + (b + xi) * alpha1 * inv_a1 + (b - xi) * alpha3 * inv_a2)
+
+
+if numba is not None:
+	# Any-layout inputs accept the zero strides of np.broadcast_to views
+	_F8_RO_2D = numba.types.Array(numba.float64, 2, "A", readonly=True)
+	_TRAPEZOID_SIG = numba.void(
+		_F8_RO_2D, _F8_RO_2D, numba.float64, numba.float64, numba.float64, numba.float64, numba.float64[:, ::1],
+	)
+
+if _aot_kernels is not None:
+	_trapezoid_kernel_njit = _aot_kernels.trapezoid_sigma_z
+elif numba is not None:
+	_trapezoid_kernel_njit = numba.njit(
+		_TRAPEZOID_SIG, parallel=True, fastmath=True, cache=True,
+	)(_trapezoid_loop)
+else:
+	_trapezoid_kernel_njit = None
+
+
+def trapezoid_sigma_z(
+	x: np.ndarray,
+	z: np.ndarray,
+	a1: float,
+	a2: float,
+	b: float,
+	q: float,
+) -> np.ndarray:
+	"""Vertical stress under a trapezoidal (embankment) strip load, plane strain at y = 0.
 
-	return sigma_z, tau_rz
\ No newline at end of file
+	Crest of half width b, side slopes of horizontal extent a1 (left) and a2 (right), crest
+	pressure q. x and z broadcast against each other; the result has their broadcast shape.
+
+	  σz = (q/π)[ α1 + α2 + α3 + (b/a1)(α1 + a1 α3 / a2) + (x/a1)(α1 − a1 α3 / a2) ]
+	     = (q/π)[ α1 + α2 + α3 + (b + x) α1 / a1 + (b − x) α3 / a2 ]
+
+	A side slope of zero width (a1 or a2 = 0) contributes no ramp term.
+	"""
+	a1 = float(a1)
+	a2 = float(a2)
+	x = np.asarray(x, dtype=float)
+	z = np.asarray(z, dtype=float)
+	if _trapezoid_kernel_njit is None:
+		# Ufuncs broadcast a row against a column straight into the (nz, nx) result
+		return _trapezoid_sigma_z_numpy(x, z, a1, a2, float(b), float(q))
+	# Broadcast views (stride 0, no copies), folded to the kernel's 2-D form
+	shape = np.broadcast_shapes(x.shape, z.shape)
+	x = np.broadcast_to(x, shape)
+	z = np.broadcast_to(z, shape)
+	if x.ndim != 2:
+		x = x.reshape(-1, shape[-1] if x.ndim else 1)
+		z = z.reshape(x.shape)
+	out = np.empty(x.shape)
+	with _PARALLEL_LOCK:
+		_trapezoid_kernel_njit(x, z, a1, a2, float(b), float(q), out)
+	return out.reshape(shape)
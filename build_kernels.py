@@ -0,0 +1,25 @@
+"""
+Ahead-of-time build of the circular and trapezoid numba kernels (optional).
+
+Compiles `bouss._circular_panels_loop` and `bouss._trapezoid_loop` into a `bouss_kernels`
+extension next to this file:
+  python build_kernels.py
+When the extension is importable, `bouss` uses it instead of compiling the loops at import, so
+a cold start does no JIT work (numba is then not needed at runtime either). AOT code runs the
+loops on one thread; skip the build to keep the parallel JIT versions.
+"""
+
+import os
+
+from numba.pycc import CC
+
+import bouss
+
+cc = CC("bouss_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("circular_panels", bouss._CIRCULAR_PANELS_SIG)(bouss._circular_panels_loop)
+cc.export("trapezoid_sigma_z", bouss._TRAPEZOID_SIG)(bouss._trapezoid_loop)
+
+
+if __name__ == "__main__":
+	cc.compile()
@@ -0,0 +1,81 @@
+"""
+Gunicorn settings for the Boussinesq app (`gunicorn -c gunicorn.conf.py app:server`).
+
+`run.py --production` uses this file and passes --bind/--workers on the command line, which
+take precedence. Run directly, bind and workers come from the environment: BIND, or PORT
+(set by Cloud Run and similar platforms), and WEB_CONCURRENCY.
+"""
+
+import os
+import sys
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# gunicorn reads this file before it changes to `chdir`, so find server_defaults next to it
+if _APP_DIR not in sys.path:
+	sys.path.insert(0, _APP_DIR)
+
+from server_defaults import default_workers, in_container
+
+
+if os.environ.get("BIND"):
+	bind = os.environ["BIND"]
+elif os.environ.get("PORT"):
+	bind = f"0.0.0.0:{os.environ['PORT']}"
+elif in_container():
+	bind = "0.0.0.0:8050"  # in a container, loopback is unreachable from outside
+else:
+	bind = "127.0.0.1:8050"
+
+workers = int(os.environ.get("WEB_CONCURRENCY") or default_workers())
+# Dash/Flask is a WSGI app, so the plain sync worker serves it directly; an ASGI worker
+# would only wrap it back into a thread per request
+worker_class = "sync"
+
+# The arbiter owns the listening socket and the workers inherit it, so connections keep
+# queueing while a worker is recycled (max_requests below). reuse_port is opt-in: on current
+# gunicorn each worker then binds its own SO_REUSEPORT socket, and every worker restart refuses
+# new connections and resets the ones queued on the retiring socket. Only turn it on for
+# several workers without recycling (REUSE_PORT=1 with --max-requests 0).
+reuse_port = os.environ.get("REUSE_PORT") == "1"
+
+# Keep idle client connections for 30 s, so a browser's next callback request reuses its
+# socket (honoured by gthread workers; the sync worker closes after every response). The
+# listen queue absorbs bursts of page loads; the kernel caps it at net.core.somaxconn.
+keepalive = 30
+backlog = 2048
+
+# Resolve app:server next to this file, whatever the launch directory
+chdir = _APP_DIR
+
+# Import the app once in the arbiter and fork it copy-on-write; this also gives every
+# worker the same launch id, so the background-callback cache is shared. Anything opened
+# at import (files, sockets, threads) is then shared by all workers too, so callbacks must
+# open their own handles.
+preload_app = True
+
+# Keep the worker heartbeat files on tmpfs instead of a possibly slow disk
+if os.path.isdir("/dev/shm"):
+	worker_tmp_dir = "/dev/shm"
+
+# No access log: every request would otherwise cost a formatted write
+# (`run.py --production --debug` passes --access-logfile - to turn it on)
+accesslog = None
+
+# Recycle each worker after ~1000 requests so slow heap growth cannot pile up; the jitter
+# staggers the restarts (cheap re-forks of the preloaded app)
+max_requests = 1000
+max_requests_jitter = 100
+
+
+def when_ready(server):
+	"""Serve the page, layout and callback map once in the arbiter, before any worker forks.
+
+	Dash finishes its server setup on the first request, and building the layout JSON pulls in
+	lazy imports; with preload_app that work then sits in pages every worker shares instead of
+	stalling each worker's first request.
+	"""
+	if not server.cfg.preload_app:
+		return
+	client = server.app.wsgi().test_client()
+	for path in ("/", "/_dash-layout", "/_dash-dependencies"):
+		client.get(path)
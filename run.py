@@ -5,50 +5,183 @@ Provides options for running in development or production mode
 """
 
 import os
+import subprocess
 import sys
 import argparse
-from app import app
+import importlib.util
+import logging
+import shlex
+import shutil
+
+from server_defaults import default_workers, in_container
+
+log = logging.getLogger("boussinesq.run")
+
+
+def __getattr__(name):
+    """Build `run:asgi_app` (the ASGI wrapper of the Flask server) for uvicorn on first access.
+
+    The Dash app is only imported here and in the dev branch of main(), so `run.py --help`
+    and the production exec path never pay for it (module __getattr__, PEP 562).
+    """
+    if name != "asgi_app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from a2wsgi import WSGIMiddleware
+    from app import app
+    if os.environ.get("BOUSS_DEV_TOOLS") == "1":
+        # Imported by `uvicorn --reload` for `run.py --debug`: same dev tools as app.run(debug=True)
+        app.enable_dev_tools(debug=True)
+    # a2wsgi runs the Flask app on a small thread pool per worker. asgiref's WsgiToAsgi
+    # serializes it on one thread and failed the second request on a kept-alive connection.
+    globals()["asgi_app"] = asgi_app = WSGIMiddleware(app.server)
+    return asgi_app
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+GUNICORN_CONF = os.path.join(APP_DIR, "gunicorn.conf.py")
+
+
+def have_a2wsgi():
+    """Whether `run:asgi_app` can be built (a2wsgi is only needed for uvicorn)."""
+    return importlib.util.find_spec("a2wsgi") is not None
+
+def server_settings():
+    """Allocator variables for the production server process (explicit settings always win)."""
+    # glibc gives each thread its own malloc arena; with worker and kernel threads that lets a
+    # long-running worker's RSS creep up. Two arenas keep it flat at no measurable cost here.
+    settings = {"MALLOC_ARENA_MAX": os.environ.get("MALLOC_ARENA_MAX", "2")}
+    preload = os.environ.get("LD_PRELOAD", "")
+    if any(lib in preload for lib in ("jemalloc", "tcmalloc")):
+        # Send Python's small objects to the preloaded allocator too, so freed memory goes
+        # back to the OS (pymalloc keeps its arenas otherwise)
+        settings["LD_PRELOAD"] = preload
+        settings["PYTHONMALLOC"] = os.environ.get("PYTHONMALLOC", "malloc")
+    return settings
+
+def server_env():
+    """Environment for the production server process."""
+    return {**os.environ, **server_settings()}
+
+def exec_server(argv, env=None):
+    """Replace this process with the server command; returns only if it is not on PATH.
+
+    No shell, no idle parent, and signals from systemd/Docker reach the server directly.
+    Windows has no real exec (os.execv spawns and exits), so there the server runs as a
+    child and its exit code is passed on.
+    """
+    # PATH lookup of the executable that will actually run (no import of the server package)
+    path = shutil.which(argv[0])
+    if path is None:
+        return
+    if os.name == "nt":
+        sys.exit(subprocess.run([path, *argv[1:]], env=env).returncode)
+    os.execve(path, argv, os.environ if env is None else env)
 
 def main():
+    # LOG_LEVEL=WARNING silences the startup lines
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+                        format="%(asctime)s %(levelname)s %(message)s")
     parser = argparse.ArgumentParser(description='Boussinesq Stress Analysis Web Application')
-    parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
+    parser.add_argument('--host', default='0.0.0.0' if in_container() else '127.0.0.1',
+                        help='Host to bind to (default: 127.0.0.1, or 0.0.0.0 inside a container)')
     parser.add_argument('--port', type=int, default=8050, help='Port to bind to (default: 8050)')
     parser.add_argument('--debug', action='store_true', help='Run in debug mode')
     parser.add_argument('--production', action='store_true', help='Run in production mode with gunicorn')
-    parser.add_argument('--workers', type=int, default=4, help='Number of gunicorn workers (production mode)')
+    parser.add_argument('--server', choices=('gunicorn', 'uvicorn'), default='gunicorn',
+                        help='Production server: gunicorn (WSGI) or uvicorn with uvloop/httptools (ASGI)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of server workers (production mode; default: 2 x usable CPUs + 1)')
+    parser.add_argument('--threads', type=int, default=1,
+                        help='Threads per gunicorn worker; > 1 uses the gthread worker (default: 1)')
+    parser.add_argument('--keepalive', type=int, default=30,
+                        help='Seconds to keep idle client connections open (default: 30)')
+    parser.add_argument('--backlog', type=int, default=2048,
+                        help='Listen queue length for pending connections (default: 2048)')
+    parser.add_argument('--print-cmd', action='store_true',
+                        help='Print the production server command line (e.g. for a systemd ExecStart=) and exit')
     
     args = parser.parse_args()
+    if args.print_cmd and not args.production:
+        parser.error('--print-cmd requires --production')
+    if args.workers is None:
+        args.workers = default_workers()
     
     if args.production:
-        # Production mode with gunicorn
-        print("🚀 Starting in production mode with gunicorn...")
-        print(f"   Host: {args.host}")
-        print(f"   Port: {args.port}")
-        print(f"   Workers: {args.workers}")
-        
-        # Check if gunicorn is available
-        try:
-            import gunicorn
-        except ImportError:
-            print("❌ gunicorn not found. Install it with: pip install gunicorn")
-            sys.exit(1)
-        
-        # Run with gunicorn
-        os.system(f"gunicorn --bind {args.host}:{args.port} --workers {args.workers} app:server")
+        # Production mode with gunicorn or uvicorn
+        if args.server == "uvicorn":
+            if not have_a2wsgi():
+                log.error("a2wsgi not found. Install it with: pip install a2wsgi")
+                sys.exit(1)
+            # One event loop per worker; uvicorn's default --loop auto picks uvloop and
+            # httptools when installed (uvicorn[standard]). Requests to the WSGI app run on a2wsgi's thread pool.
+            argv = [
+                "uvicorn", "run:asgi_app", "--host", args.host, "--port", str(args.port),
+                "--workers", str(args.workers), "--app-dir", APP_DIR,
+                "--timeout-keep-alive", str(args.keepalive), "--backlog", str(args.backlog),
+            ]
+            if not args.debug:
+                argv.append("--no-access-log")
+        else:
+            # Tuning (preload, worker recycling, tmp dir, chdir) lives in gunicorn.conf.py;
+            # the options given on the command line override its defaults
+            argv = [
+                "gunicorn", "-c", GUNICORN_CONF,
+                "--bind", f"{args.host}:{args.port}", "--workers", str(args.workers),
+                "--keep-alive", str(args.keepalive), "--backlog", str(args.backlog),
+            ]
+            if args.threads > 1:
+                # Several threads per worker serve Dash's many small requests (layout, assets,
+                # callback and job polling) concurrently at one worker's memory. Heavy compute
+                # still takes the GIL, so the worker count is what scales the number crunching.
+                argv += ["--worker-class", "gthread", "--threads", str(args.threads)]
+            if args.debug:
+                # Access log to stderr for troubleshooting; off otherwise (see gunicorn.conf.py)
+                argv += ["--access-logfile", "-"]
+            argv.append("app:server")
+        if args.print_cmd:
+            # Absolute executable paths, as systemd wants them; a unit file with this line
+            # restarts the server without running Python and argparse first. The env prefix
+            # carries the allocator settings that exec_server() would pass.
+            settings = [f"{key}={value}" for key, value in server_settings().items()]
+            print(shlex.join([
+                shutil.which("env") or "env", *settings, shutil.which(argv[0]) or argv[0], *argv[1:],
+            ]))
+            return
+        log.info("Starting in production mode with %s on %s:%d (workers: %d%s)",
+                 args.server, args.host, args.port, args.workers,
+                 f", threads: {args.threads}" if args.server == "gunicorn" else "")
+        exec_server(argv, server_env())
+        log.error("%s not found. Install it with: pip install %s", args.server, args.server)
+        sys.exit(1)
     else:
         # Development mode
-        print("🛠️  Starting in development mode...")
-        print(f"   Host: {args.host}")
-        print(f"   Port: {args.port}")
-        print(f"   Debug: {args.debug}")
-        print(f"   Open: http://{args.host}:{args.port}")
+        log.info("Starting in development mode (debug: %s), open http://%s:%d",
+                 args.debug, args.host, args.port)
+        
+        if args.debug and have_a2wsgi():
+            # Code reloads via uvicorn's watchfiles-based reloader (native file events)
+            # instead of Werkzeug polling every module; Dash's dev tools stay on
+            os.environ["BOUSS_DEV_TOOLS"] = "1"
+            exec_server([
+                "uvicorn", "run:asgi_app", "--host", args.host, "--port", str(args.port),
+                "--app-dir", APP_DIR, "--reload", "--reload-dir", APP_DIR,
+            ])
+            # Still here: no uvicorn, fall back to the Werkzeug dev server
         
-        app.run(
-            host=args.host,
-            port=args.port,
-            debug=args.debug,
-            dev_tools_hot_reload=args.debug,
-            dev_tools_ui=args.debug
+        from werkzeug.serving import run_simple
+        from app import app
+        # What app.run(debug=...) sets up, then Werkzeug directly: no Flask CLI/dotenv pass.
+        # threaded=True lets concurrent callback requests overlap; no reloader/debugger (or
+        # their module polling) unless debugging.
+        app.enable_dev_tools(debug=args.debug, dev_tools_ui=args.debug, dev_tools_hot_reload=args.debug)
+        app.server.debug = args.debug
+        run_simple(
+            args.host,
+            args.port,
+            app.server,
+            use_reloader=args.debug,
+            use_debugger=args.debug,
+            threaded=True,
         )
 
 if __name__ == '__main__':
@@ -0,0 +1,21 @@
+"""
+Deployment defaults shared by `run.py` and `gunicorn.conf.py`.
+
+Standard library only, so both can import it before the app (or a server package) loads.
+"""
+
+import os
+
+
+def default_workers():
+	"""Gunicorn's 2 x cores + 1, counting only the CPUs this process may run on (cgroup/taskset)."""
+	try:
+		cores = len(os.sched_getaffinity(0))
+	except AttributeError:  # not available on macOS/Windows
+		cores = os.cpu_count() or 1
+	return 2 * cores + 1
+
+
+def in_container():
+	"""Docker or Kubernetes, where binding 127.0.0.1 leaves the app unreachable from outside."""
+	return os.path.exists("/.dockerenv") or "KUBERNETES_SERVICE_HOST" in os.environ